@@ -0,0 +1,505 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+import time
+
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import scopus_crawler
+from scopus_crawler import (
+    AsyncFetchEngine,
+    HttpFetcher,
+    ScopusCrawler,
+    format_papers_frame,
+    write_excel_sheets,
+)
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_fixtures")
+
+DEFAULT_COMMAND_BUDGETS = {
+    "get_detailed_author_info": 30,
+    "fill_author_details": 0,
+    "extract_author_affiliation_mapping": 0,
+    "extract_page_payload": 1,
+    "apply_llm_filter": 0,
+}
+
+COUNTRIES = ["South Korea", "United States", "China", "Germany", "Japan", "United Kingdom"]
+
+DETAIL_FIXTURES = [
+    {
+        "id": "8500000001",
+        "name": "single_author",
+        "title": "Large language models for spectrum management",
+        "authors": 1,
+        "affiliations": 1,
+        "sups": True,
+    },
+    {
+        "id": "8500000002",
+        "name": "ten_authors",
+        "title": "LLM agents for embodied IoT devices",
+        "authors": 10,
+        "affiliations": 4,
+        "sups": True,
+    },
+    {
+        "id": "8500000003",
+        "name": "hundred_authors",
+        "title": "A survey of LLMs in wireless communications",
+        "authors": 120,
+        "affiliations": 30,
+        "sups": True,
+    },
+    {
+        "id": "8500000004",
+        "name": "missing_sup",
+        "title": "Embodied LLM controllers without superscripts",
+        "authors": 6,
+        "affiliations": 3,
+        "sups": False,
+    },
+    {
+        "id": "8500000005",
+        "name": "multi_affiliation",
+        "title": "LLM-based resource allocation across institutions",
+        "authors": 8,
+        "affiliations": 5,
+        "sups": "multi",
+    },
+    {
+        "id": "8500000006",
+        "name": "no_llm",
+        "title": "Energy harvesting for sensor networks",
+        "authors": 3,
+        "affiliations": 2,
+        "sups": True,
+    },
+]
+
+
+def affiliation_key(index):
+    letters = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(ord("a") + rest) + letters
+    return letters
+
+
+def render_detail_page(fixture):
+    affiliation_keys = [affiliation_key(i) for i in range(fixture["affiliations"])]
+
+    author_items = []
+    for i in range(fixture["authors"]):
+        if fixture["sups"] == "multi":
+            sups = ", ".join(affiliation_keys[j % len(affiliation_keys)] for j in (i, i + 1, i + 2))
+        else:
+            sups = affiliation_keys[i % len(affiliation_keys)]
+
+        sup_html = (
+            f'<sup class="AuthorList_affiliation__bTM3u">{sups}</sup>' if fixture["sups"] else ""
+        )
+        email_html = (
+            f'<a href="mailto:author{i + 1}@example.org">Email</a>' if i % 3 == 0 else ""
+        )
+        author_items.append(
+            f'<li data-testid="authorItem-button"><button>'
+            f'<span class="Button_text__0dddp">Author{i + 1}, A.</span></button>'
+            f"{sup_html}{email_html}</li>"
+        )
+
+    affiliation_items = []
+    for i, key in enumerate(affiliation_keys):
+        text = (
+            f"Department {i + 1}, University of Example {i + 1}, City {i + 1}, "
+            f"{COUNTRIES[i % len(COUNTRIES)]}"
+        )
+        if fixture["sups"]:
+            affiliation_items.append(f"<li><sup>{key}</sup><span>{text}</span></li>")
+        else:
+            affiliation_items.append(f"<li>{text}</li>")
+
+    abstract = (
+        "We study how large language models can coordinate devices. "
+        "Experiments, e.g. on 5G testbeds, show gains over baselines et al. reported. "
+        "The LLM planner reduces latency by 30%."
+        if fixture["name"] != "no_llm"
+        else "We study energy harvesting circuits for low power sensor nodes."
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>{fixture["title"]}</title></head>
+<body>
+<h2 data-testid="publication-titles">{fixture["title"]}</h2>
+<div id="document-details-abstract"><p>{abstract}</p></div>
+<button type="button"><span>Show all information</span></button>
+<div class="DetailedInformationFlyout">
+<section data-testid="detailed-information-authors">
+<ul class="DetailedInformationFlyout_list__76Ipn">
+{chr(10).join(author_items)}
+</ul>
+</section>
+<section data-testid="detailed-information-affiliations">
+<ul class="DetailedInformationFlyout_list__76Ipn">
+{chr(10).join(affiliation_items)}
+</ul>
+</section>
+</div>
+</body>
+</html>
+"""
+
+
+def render_results_page():
+    rows = []
+    for fixture in DETAIL_FIXTURES:
+        rows.append(
+            f'<tr class="TableItems-module__A6xTk"><td>'
+            f'<h3><a href="/pages/publications/{fixture["id"]}">{fixture["title"]}</a></h3>'
+            f"</td></tr>"
+        )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>Search results</title></head>
+<body>
+<h2 data-testid="results-count"><span>{len(DETAIL_FIXTURES)}</span> documents found</h2>
+<select class="Select-module__vDMww">
+<option value="10" selected>10</option>
+<option value="20">20</option>
+<option value="50">50</option>
+</select>
+<table><tbody>
+{chr(10).join(rows)}
+</tbody></table>
+<nav aria-label="pagination"><button aria-current="true">1</button>
+<button disabled><span>Next</span></button></nav>
+</body>
+</html>
+"""
+
+
+def render_search_page():
+    return """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>Document search</title></head>
+<body>
+<form action="/results/results.uri" method="get">
+<input name="s" placeholder=" " class="styleguide-input_input">
+<select name="within" data-testid="select-search-within">
+<option value="TITLE-ABS-KEY">All</option>
+<option value="KEY">Keywords</option>
+</select>
+<button type="submit" class="Button_button">Search</button>
+</form>
+</body>
+</html>
+"""
+
+
+def write_fixtures(directory=FIXTURE_DIR):
+    pages = {
+        "search/form.uri.html": render_search_page(),
+        "results/results.uri.html": render_results_page(),
+    }
+    for fixture in DETAIL_FIXTURES:
+        pages[f"pages/publications/{fixture['id']}.html"] = render_detail_page(fixture)
+
+    for relative_path, html in pages.items():
+        path = os.path.join(directory, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+    return len(pages)
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    def translate_path(self, path):
+        relative_path = urlparse(path).path.lstrip("/")
+        return os.path.join(self.directory, relative_path + ".html")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(directory=FIXTURE_DIR, port=0):
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", port), partial(FixtureHandler, directory=directory)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def read_fixture(fixture):
+    path = os.path.join(FIXTURE_DIR, "pages", "publications", fixture["id"] + ".html")
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def detail_links(base_url):
+    return [f"{base_url}/pages/publications/{fixture['id']}" for fixture in DETAIL_FIXTURES]
+
+
+def benchmark_offline_extraction(base_url, repeat):
+    crawler = ScopusCrawler()
+    fixtures = {}
+    for fixture, paper_link in zip(DETAIL_FIXTURES, detail_links(base_url)):
+        html = read_fixture(fixture)
+
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            crawler.get_detailed_author_info_from_html(paper_link, html)
+        elapsed = (time.perf_counter() - started_at) / repeat
+        fixtures[fixture["name"]] = {"seconds_per_paper": elapsed}
+
+    return {"fixtures": fixtures}
+
+
+def benchmark_fetch_backend(base_url, fetcher_class):
+    crawler = ScopusCrawler()
+    crawler.http_fetcher = fetcher_class(concurrency=4)
+
+    fallbacks = []
+
+    def browser_fallback(paper_link):
+        fallbacks.append(paper_link)
+        return crawler.empty_detailed_info(paper_link)
+
+    crawler.get_detailed_author_info = browser_fallback
+
+    links = detail_links(base_url)
+    try:
+        started_at = time.perf_counter()
+        fetched = crawler.fetch_detailed_infos(links)
+        elapsed = time.perf_counter() - started_at
+    finally:
+        crawler.http_fetcher.close()
+
+    if fallbacks:
+        raise AssertionError(
+            f"{fetcher_class.__name__} fell back to the browser for {len(fallbacks)} papers"
+        )
+
+    for fixture, paper_link, detailed_info in zip(DETAIL_FIXTURES, links, fetched):
+        expected = crawler.get_detailed_author_info_from_html(paper_link, read_fixture(fixture))
+        if detailed_info["authors"] != expected["authors"]:
+            raise AssertionError(
+                f"{fetcher_class.__name__} extracted {len(detailed_info['authors'])} authors "
+                f"for {fixture['name']}, expected {len(expected['authors'])}"
+            )
+
+    return {
+        "seconds": elapsed,
+        "papers": len(fetched),
+        "papers_per_minute": len(fetched) / elapsed * 60 if elapsed else 0,
+    }
+
+
+def benchmark_exports(papers, copies, output_dir):
+    crawler = ScopusCrawler()
+    records = [dict(paper) for _ in range(copies) for paper in papers]
+    crawler.results_data = {keyword: records for keyword in crawler.keywords[:2]}
+
+    started_at = time.perf_counter()
+    frame = format_papers_frame(records)
+    format_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    write_excel_sheets(os.path.join(output_dir, "benchmark_batch.xlsx"), [("Sheet1", frame)])
+    batch_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    crawler.save_to_excel(os.path.join(output_dir, "benchmark_results.xlsx"))
+    save_to_excel_seconds = time.perf_counter() - started_at
+
+    return {
+        "papers": len(records),
+        "author_rows": len(frame),
+        "format_seconds": format_seconds,
+        "save_batch_seconds": batch_seconds,
+        "save_to_excel_seconds": save_to_excel_seconds,
+    }
+
+
+def benchmark_browser(base_url, headless, command_budgets=None):
+    crawler = ScopusCrawler(
+        prefilter_mode="off",
+        headless=headless,
+        base_url=base_url,
+        trace_commands=True,
+        command_budgets=command_budgets,
+    )
+    crawler.setup_driver()
+    tracer = crawler.command_tracer
+
+    try:
+        crawler.driver.get(base_url + "/search/form.uri?display=basic")
+
+        details = {}
+        papers = []
+        for fixture, paper_link in zip(DETAIL_FIXTURES, detail_links(base_url)):
+            started_at = time.perf_counter()
+            detailed_info = crawler.get_detailed_author_info(paper_link)
+            report = tracer.last_report
+            details[fixture["name"]] = {
+                "seconds": time.perf_counter() - started_at,
+                "webdriver_commands": report["get_detailed_author_info"]["commands"],
+                "protocol_seconds": report["get_detailed_author_info"]["seconds"],
+                "methods": report,
+                "authors": len(detailed_info["authors"]),
+            }
+            papers.append(detailed_info)
+
+        crawler.seen_papers = set()
+        snapshot = tracer.snapshot()
+        started_at = time.perf_counter()
+        crawled, _ = crawler.crawl_pages("LLM benchmark", max_pages=1)
+        crawl_seconds = time.perf_counter() - started_at
+        crawl_report = tracer.report(snapshot)
+        crawl_commands = crawl_report.get("crawl_pages", {}).get("commands", 0)
+
+        if tracer.violations:
+            raise AssertionError("; ".join(tracer.violations))
+        if len(crawled) != len(DETAIL_FIXTURES):
+            raise AssertionError(
+                f"crawl_pages returned {len(crawled)} papers, expected {len(DETAIL_FIXTURES)}"
+            )
+
+        return {
+            "get_detailed_author_info": details,
+            "crawl_pages": {
+                "seconds": crawl_seconds,
+                "papers": len(crawled),
+                "papers_per_minute": len(crawled) / crawl_seconds * 60 if crawl_seconds else 0,
+                "webdriver_commands": crawl_commands,
+                "webdriver_commands_per_paper": crawl_commands / len(crawled) if crawled else 0,
+                "methods": crawl_report,
+            },
+            "webdriver_command_names": dict(tracer.command_counts),
+        }, papers
+    finally:
+        crawler.driver.quit()
+
+
+def run_benchmark(
+    output="bench_results.json",
+    headless=True,
+    skip_browser=False,
+    repeat=20,
+    copies=500,
+    command_budgets=None,
+):
+    server, base_url = start_fixture_server()
+    output_dir = tempfile.mkdtemp(prefix="scopus_bench_")
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "base_url": base_url,
+        "phases": {},
+    }
+
+    previous_dir = os.getcwd()
+    os.chdir(output_dir)
+    try:
+        crawler = ScopusCrawler()
+        papers = [
+            crawler.get_detailed_author_info_from_html(paper_link, read_fixture(fixture))
+            for fixture, paper_link in zip(DETAIL_FIXTURES, detail_links(base_url))
+        ]
+
+        if scopus_crawler.lxml is not None:
+            results["phases"]["offline_extraction"] = benchmark_offline_extraction(base_url, repeat)
+            results["phases"]["http_fetch"] = benchmark_fetch_backend(base_url, HttpFetcher)
+            if scopus_crawler.aiohttp is not None:
+                results["phases"]["async_fetch"] = benchmark_fetch_backend(
+                    base_url, AsyncFetchEngine
+                )
+
+        if not skip_browser:
+            try:
+                results["phases"]["browser"], papers = benchmark_browser(
+                    base_url, headless, command_budgets
+                )
+            except AssertionError:
+                raise
+            except Exception as e:
+                logger.warning(f"Browser benchmark skipped: {str(e)}")
+                results["phases"]["browser"] = {"skipped": str(e)}
+
+        results["phases"]["exports"] = benchmark_exports(papers, copies, output_dir)
+    finally:
+        os.chdir(previous_dir)
+        server.shutdown()
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info(f"Benchmark results saved to {output}")
+    return results
+
+
+def parse_command_budgets(enforce, overrides):
+    if not enforce and not overrides:
+        return None
+
+    budgets = dict(DEFAULT_COMMAND_BUDGETS)
+    for override in overrides:
+        method, _, commands = override.partition("=")
+        budgets[method.strip()] = int(commands)
+
+    return budgets
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline Scopus crawler benchmark")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--show-browser", action="store_true")
+    parser.add_argument("--skip-browser", action="store_true")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--copies", type=int, default=500)
+    parser.add_argument(
+        "--enforce-budgets",
+        action="store_true",
+        help="Fail when a hot path issues more WebDriver commands per paper than its budget",
+    )
+    parser.add_argument(
+        "--command-budget",
+        action="append",
+        default=[],
+        metavar="METHOD=COMMANDS",
+        help="Override or add a per-paper WebDriver command budget (implies --enforce-budgets)",
+    )
+    parser.add_argument(
+        "--regenerate-fixtures",
+        action="store_true",
+        help="Rewrite the fixture pages in benchmark_fixtures/ before running",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.regenerate_fixtures:
+        print(f"Fixtures written: {write_fixtures()}")
+
+    results = run_benchmark(
+        output=args.output,
+        headless=not args.show_browser,
+        skip_browser=args.skip_browser,
+        repeat=args.repeat,
+        copies=args.copies,
+        command_budgets=parse_command_budgets(args.enforce_budgets, args.command_budget),
+    )
+    print(json.dumps(results, indent=2))
@@ -0,0 +1,153 @@
+import argparse
+import logging
+import time
+
+import pandas as pd
+
+from scopus_crawler import (
+    DEFAULT_KEYWORDS,
+    SKIPPED_SENTENCES,
+    UNASSIGNED_KEYWORD,
+    PaperCorpus,
+    TermMatcher,
+    detect_sentences,
+    format_papers_frame,
+    load_terms,
+    matches_query_clauses,
+    paper_search_text,
+    parse_keyword_query,
+    unique_sheet_name,
+    write_excel_sheets,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def reclassify_papers(papers, matcher, filter_term="LLM"):
+    frame = pd.DataFrame(
+        {
+            "title": [paper.get("title") or "" for paper in papers],
+            "abstract": [paper.get("abstract") or "" for paper in papers],
+        }
+    )
+    matched = (
+        matcher.classify_series(frame["title"], [filter_term])[filter_term]
+        | matcher.classify_series(frame["abstract"], [filter_term])[filter_term]
+    )
+
+    stats = {"papers": len(papers), "matched": 0, "changed": 0, "missing_authors": []}
+    for paper, is_match in zip(papers, matched):
+        was_match = paper.get("detected_sentences") != SKIPPED_SENTENCES
+
+        if is_match:
+            paper["detected_sentences"] = detect_sentences(
+                matcher, paper.get("title"), paper.get("abstract"), filter_term
+            )
+            stats["matched"] += 1
+            if not paper.get("has_authors"):
+                stats["missing_authors"].append(paper.get("link", ""))
+        else:
+            paper["detected_sentences"] = SKIPPED_SENTENCES
+
+        if was_match != bool(is_match):
+            stats["changed"] += 1
+
+    return stats
+
+
+def paper_keywords(paper, keyword_clauses):
+    text = paper_search_text(paper)
+    return [
+        keyword
+        for keyword, clauses in keyword_clauses.items()
+        if keyword in (paper.get("keywords") or []) or matches_query_clauses(clauses, text)
+    ]
+
+
+def keyword_sheets(papers, keywords=None):
+    keyword_clauses = {
+        keyword: parse_keyword_query(keyword) for keyword in keywords or DEFAULT_KEYWORDS
+    }
+
+    keyword_papers = {}
+    for paper in papers:
+        for keyword in paper_keywords(paper, keyword_clauses) or [UNASSIGNED_KEYWORD]:
+            keyword_papers.setdefault(keyword, []).append(paper)
+
+    used = set()
+    return [
+        (unique_sheet_name(keyword, used), format_papers_frame(grouped))
+        for keyword, grouped in keyword_papers.items()
+    ]
+
+
+def reclassify_corpus(
+    corpus_path="scopus_corpus.sqlite3",
+    output="scopus_papers_reclassified.xlsx",
+    terms=None,
+    filter_term="LLM",
+    missing_authors_path=None,
+    keywords=None,
+):
+    corpus = PaperCorpus(corpus_path)
+    try:
+        papers = list(corpus.papers())
+    finally:
+        corpus.close()
+
+    started_at = time.perf_counter()
+    stats = reclassify_papers(papers, TermMatcher(terms, filter_term), filter_term)
+    stats["classify_seconds"] = time.perf_counter() - started_at
+
+    write_excel_sheets(output, keyword_sheets(papers, keywords))
+    logger.info(f"Re-classified results saved to {output}")
+
+    if missing_authors_path and stats["missing_authors"]:
+        with open(missing_authors_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(stats["missing_authors"]) + "\n")
+        logger.info(f"Links that still need author details saved to {missing_authors_path}")
+
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Re-apply detection rules to the stored title/abstract corpus without crawling"
+    )
+    parser.add_argument("--corpus-path", default="scopus_corpus.sqlite3")
+    parser.add_argument("--output", default="scopus_papers_reclassified.xlsx")
+    parser.add_argument(
+        "--terms",
+        default=None,
+        help='JSON file mapping term labels to regex lists, e.g. {"LLM": ["llms?"]}',
+    )
+    parser.add_argument("--filter-term", default="LLM")
+    parser.add_argument(
+        "--keyword",
+        action="append",
+        dest="keywords",
+        default=None,
+        help="Keyword query to build a sheet for (repeatable, defaults to the crawler's keywords)",
+    )
+    parser.add_argument(
+        "--missing-authors",
+        default="scopus_missing_authors.txt",
+        help="Where to list newly matching papers whose author details were never fetched",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    stats = reclassify_corpus(
+        corpus_path=args.corpus_path,
+        output=args.output,
+        terms=load_terms(args.terms),
+        filter_term=args.filter_term,
+        missing_authors_path=args.missing_authors,
+        keywords=args.keywords,
+    )
+    print(f"Papers in corpus: {stats['papers']}")
+    print(f"Matching '{args.filter_term}': {stats['matched']} ({stats['changed']} decisions changed)")
+    print(f"Matching papers without author details: {len(stats['missing_authors'])}")
+    print(f"Classification time: {stats['classify_seconds']:.2f} s")
@@ -0,0 +1,161 @@
+import argparse
+import logging
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from reclassify_corpus import keyword_sheets
+from scopus_crawler import (
+    PageArchive,
+    PaperCorpus,
+    ScopusCrawler,
+    load_terms,
+    read_archived_page,
+    write_excel_sheets,
+)
+
+logger = logging.getLogger(__name__)
+
+crawler = None
+
+
+def init_worker(terms=None, filter_term="LLM"):
+    global crawler
+    crawler = ScopusCrawler(
+        metrics_json_path=None,
+        metrics_prometheus_path=None,
+        topic_terms=terms,
+        filter_term=filter_term,
+    )
+
+
+def extract_chunk(archive_path, entries):
+    results = []
+    with open(archive_path, "rb") as f:
+        for eid, link, offset, length in entries:
+            try:
+                detailed_info = crawler.get_detailed_author_info_from_html(
+                    link, read_archived_page(f, offset, length)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to re-extract {eid}: {str(e)}")
+                detailed_info = None
+            results.append((eid, detailed_info))
+
+    return results
+
+
+def chunked(entries, size):
+    for start in range(0, len(entries), size):
+        yield entries[start:start + size]
+
+
+def reextract_archive(archive_path, workers=None, chunk_size=200, terms=None, filter_term="LLM"):
+    archive = PageArchive(archive_path)
+    try:
+        entries = archive.entries()
+    finally:
+        archive.close()
+
+    papers = {}
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=init_worker,
+        initargs=(terms, filter_term),
+    ) as executor:
+        futures = [
+            executor.submit(extract_chunk, archive_path, chunk)
+            for chunk in chunked(entries, chunk_size)
+        ]
+        for future in futures:
+            for eid, detailed_info in future.result():
+                if detailed_info is None:
+                    failed.append(eid)
+                else:
+                    papers[eid] = detailed_info
+
+    return papers, failed
+
+
+def load_corpus_keywords(papers, corpus_path=None):
+    if not corpus_path or not os.path.exists(corpus_path):
+        return
+
+    corpus = PaperCorpus(corpus_path)
+    try:
+        stored_keywords = {paper["eid"]: paper["keywords"] for paper in corpus.papers()}
+    finally:
+        corpus.close()
+
+    for eid, detailed_info in papers.items():
+        detailed_info["keywords"] = stored_keywords.get(eid, [])
+
+
+def update_corpus(corpus_path, papers):
+    corpus = PaperCorpus(corpus_path)
+    try:
+        for eid, detailed_info in papers.items():
+            corpus.put(eid, detailed_info, prefer_new=True)
+    finally:
+        corpus.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Re-run author/affiliation/email extraction over archived detail pages"
+    )
+    parser.add_argument("--archive-path", default="scopus_pages.zst")
+    parser.add_argument("--output", default="scopus_papers_reextracted.xlsx")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument(
+        "--terms",
+        default=None,
+        help='JSON file mapping term labels to regex lists, e.g. {"LLM": ["llms?"]}',
+    )
+    parser.add_argument("--filter-term", default="LLM")
+    parser.add_argument(
+        "--keyword",
+        action="append",
+        dest="keywords",
+        default=None,
+        help="Keyword query to build a sheet for (repeatable, defaults to the crawler's keywords)",
+    )
+    parser.add_argument(
+        "--corpus-path",
+        default="scopus_corpus.sqlite3",
+        help="Corpus used to group papers by keyword",
+    )
+    parser.add_argument(
+        "--update-corpus",
+        action="store_true",
+        help="Write the re-extracted author details back into the corpus",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    started_at = time.perf_counter()
+    papers, failed = reextract_archive(
+        args.archive_path,
+        args.workers,
+        args.chunk_size,
+        terms=load_terms(args.terms),
+        filter_term=args.filter_term,
+    )
+    elapsed = time.perf_counter() - started_at
+
+    load_corpus_keywords(papers, args.corpus_path)
+    write_excel_sheets(args.output, keyword_sheets(list(papers.values()), args.keywords))
+    logger.info(f"Re-extracted results saved to {args.output}")
+
+    if args.update_corpus:
+        update_corpus(args.corpus_path, papers)
+
+    print(f"Pages re-extracted: {len(papers)} in {elapsed:.1f} s")
+    if failed:
+        print(f"Pages without extractable authors: {len(failed)}")
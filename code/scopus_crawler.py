@@ -4,46 +4,2000 @@ import time
 import re
 import random
 import logging
+import queue
+import json
+import sqlite3
+import argparse
+import os
+import sys
+import math
+import csv
+import glob
+import asyncio
+import threading
+import functools
+import itertools
+import zlib
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    SessionNotCreatedException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select
-from urllib.parse import urlparse
+from selenium.webdriver.common.keys import Keys
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+AUTHOR_PAYLOAD_SCRIPT = """
+const text = (el) => (el ? (el.innerText || el.textContent || "").trim() : null);
+
+const affiliations = Array.from(document.querySelectorAll(
+    "section[data-testid='detailed-information-affiliations'] ul.DetailedInformationFlyout_list__76Ipn li"
+)).map((li) => {
+    const sup = li.querySelector("sup");
+    const span = li.querySelector("span");
+    return {
+        sup: sup && span ? text(sup) : null,
+        span: sup && span ? text(span) : null,
+        text: text(li),
+    };
+});
+
+const authors = Array.from(document.querySelectorAll(
+    "ul.DetailedInformationFlyout_list__76Ipn li[data-testid='authorItem-button']"
+)).map((li) => {
+    const nameEl = li.querySelector("span.Button_text__0dddp");
+    let email = "";
+    for (let node = nameEl; node && !email; node = node.parentElement) {
+        if (node.tagName === "LI") {
+            const mailto = node.querySelector("a[href^='mailto:']");
+            if (mailto) {
+                email = mailto.getAttribute("href");
+            }
+        }
+    }
+    return {
+        name: text(nameEl),
+        sups: Array.from(li.querySelectorAll("sup.AuthorList_affiliation__bTM3u")).map(text),
+        email: email,
+    };
+});
+
+const keywords = Array.from(document.querySelectorAll(
+    "section#author-keywords span, section[data-testid='author-keywords'] span"
+)).map(text).filter((keyword) => keyword);
+
+const indexKeywords = Array.from(document.querySelectorAll(
+    "section#indexed-keywords span, section[data-testid='indexed-keywords'] span"
+)).map(text).filter((keyword) => keyword);
+
+return {
+    affiliations: affiliations,
+    authors: authors,
+    keywords: keywords,
+    index_keywords: indexKeywords,
+};
+"""
+
+BLOCKED_PAGE_SCRIPT = """
+const title = (document.title || "").toLowerCase();
+const body = document.body ? (document.body.innerText || "").slice(0, 2000).toLowerCase() : "";
+return title.includes("captcha")
+    || title.includes("access denied")
+    || body.includes("unusual traffic")
+    || body.includes("are you a robot")
+    || document.querySelector("iframe[src*='captcha'], #challenge-form") !== null;
+"""
+
+CURRENT_PAGE_SCRIPT = """
+const current = document.querySelector(
+    "nav[aria-label*='agination'] [aria-current='true'], "
+    + "nav[aria-label*='agination'] [aria-current='page'], "
+    + "[data-testid*='pagination'] [aria-current='true']"
+);
+if (current) {
+    return parseInt((current.innerText || current.textContent || "").trim(), 10) || null;
+}
+const input = document.querySelector("nav[aria-label*='agination'] input");
+return input ? parseInt(input.value, 10) || null : null;
+"""
+
+RESULT_COUNT_SCRIPT = """
+const candidates = document.querySelectorAll(
+    "[data-testid='results-count'], [data-testid*='result-count'], h1, h2, h3"
+);
+for (const element of candidates) {
+    const text = (element.innerText || element.textContent || "").replace(/\\s+/g, " ");
+    const match = text.match(/([\\d][\\d,.]*)\\s+(documents?|results?)\\b/i);
+    if (match) {
+        return parseInt(match[1].replace(/[,.]/g, ""), 10);
+    }
+}
+return null;
+"""
+
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*nr-data.net*",
+    "*newrelic.com*",
+    "*adobedtm.com*",
+    "*omtrdc.net*",
+    "*demdex.net*",
+    "*pendo.io*",
+    "*optimizely.com*",
+    "*facebook.net*",
+]
+
+RESULT_ROWS_SCRIPT = """
+const text = (el) => (el ? (el.innerText || el.textContent || "").trim() : "");
+
+return Array.from(arguments[0]).map((row) => {
+    const link = row.querySelector("h3 a");
+    const abstract = row.querySelector("[data-testid='abstract-text']");
+    return {
+        href: link ? link.href : null,
+        title: text(link),
+        abstract: text(abstract),
+    };
+});
+"""
+
+
+def parse_eid(paper_link):
+    parsed = urlparse(paper_link)
+
+    eid = parse_qs(parsed.query).get("eid")
+    if eid and eid[0]:
+        return eid[0]
+
+    match = re.search(r"/pages/publications/(\d+)", parsed.path)
+    if match:
+        return f"2-s2.0-{match.group(1)}"
+
+    match = re.search(r"(2-s2\.0-\d+)", paper_link)
+    if match:
+        return match.group(1)
+
+    return None
+
+
+DEFAULT_KEYWORDS = [
+    "LLM embodied",
+    "LLM AND IoT",
+    "LLM wireless communications",
+    "embodied AI AND IoT",
+    "embodied AI internet of things",
+    "LLM spectrum management",
+    "embodied AI wireless communication",
+    "LLM OR large language model",
+]
+
+QUERY_STOPWORDS = {"a", "an", "the", "of", "in", "on", "for", "to", "with"}
+
+
+def parse_keyword_query(query):
+    tokens = re.findall(r'\(|\)|"[^"]*"|[^\s()"]+', query)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def parse_atom():
+        nonlocal position
+        token = peek()
+        if token is None:
+            return [frozenset()]
+
+        position += 1
+        if token == "(":
+            clauses = parse_and()
+            if peek() == ")":
+                position += 1
+            return clauses
+
+        term = token.strip('"').strip().lower()
+        if not term or term in QUERY_STOPWORDS:
+            return [frozenset()]
+        return [frozenset([term])]
+
+    def parse_or():
+        nonlocal position
+        clauses = parse_atom()
+        while peek() is not None and peek().upper() == "OR":
+            position += 1
+            clauses = clauses + parse_atom()
+        return clauses
+
+    def parse_and():
+        nonlocal position
+        clauses = parse_or()
+        while peek() is not None and peek() != ")":
+            if peek().upper() == "AND":
+                position += 1
+            right = parse_or()
+            clauses = [left | other for left in clauses for other in right]
+        return clauses
+
+    return minimize_clauses(parse_and())
+
+
+def minimize_clauses(clauses):
+    minimized = []
+    for clause in sorted(dict.fromkeys(clauses), key=len):
+        if clause and not any(kept <= clause for kept in minimized):
+            minimized.append(clause)
+    return minimized
+
+
+def render_query_clause(clause):
+    terms = [f'"{term}"' if " " in term else term for term in sorted(clause)]
+    if len(terms) == 1:
+        return terms[0]
+    return "(" + " AND ".join(terms) + ")"
+
+
+def consolidate_keyword_queries(keywords, max_length=1000):
+    clauses = minimize_clauses(
+        [clause for keyword in keywords for clause in parse_keyword_query(keyword)]
+    )
 
-class ScopusCrawler:
-    def __init__(self, start_keyword_index=0, start_page=1):
-        self.keywords = [
-            "LLM embodied", 
-            "LLM AND IoT",
-            "LLM wireless communications",
-            "embodied AI AND IoT",
-            "embodied AI internet of things",
-            "LLM spectrum management",
-            "embodied AI wireless communication",
-            "LLM OR large language model"
+    queries = []
+    current = []
+    for clause in clauses:
+        rendered = render_query_clause(clause)
+        if current and len(" OR ".join(current + [rendered])) > max_length:
+            queries.append(" OR ".join(current))
+            current = []
+        current.append(rendered)
+
+    if current:
+        queries.append(" OR ".join(current))
+
+    return queries
+
+
+@functools.lru_cache(maxsize=None)
+def query_term_pattern(term):
+    stem = term[:-1] if term.endswith("s") and len(term) > 3 else term
+    words = [re.escape(word) for word in stem.split()]
+    return re.compile(r"\b" + r"\W+".join(words) + r"(?:s|es)?\b", re.IGNORECASE)
+
+
+def paper_search_text(detailed_info):
+    return " ".join(
+        [detailed_info.get("title") or "", detailed_info.get("abstract") or ""]
+        + list(detailed_info.get("author_keywords") or [])
+        + list(detailed_info.get("index_keywords") or [])
+    )
+
+
+def matches_query_clauses(clauses, text):
+    return any(
+        all(query_term_pattern(term).search(text) for term in clause) for clause in clauses
+    )
+
+
+TOPIC_TERMS = {
+    "LLM": [r"llms?", r"large\s+language\s+model\w*"],
+    "IoT": [r"iot", r"internet[\s-]+of[\s-]+things"],
+    "embodied AI": [r"embodied\s+(?:ai|agents?|intelligence)"],
+    "spectrum": [r"spectrum"],
+    "wireless": [r"wireless"],
+}
+
+SKIPPED_SENTENCES = "No LLM keywords found - skipped"
+
+UNASSIGNED_KEYWORD = "(unassigned)"
+
+SENTENCE_ABBREVIATIONS = {
+    "al", "approx", "cf", "e.g", "eq", "eqs", "etc", "fig", "figs", "i.e",
+    "no", "ref", "refs", "resp", "sec", "viz", "vs",
+}
+
+
+class TermMatcher:
+    def __init__(self, terms=None, filter_term=None):
+        self.terms = dict(terms or TOPIC_TERMS)
+        self.labels = list(self.terms)
+        if filter_term and filter_term not in self.terms:
+            raise ValueError(
+                f"Filter term '{filter_term}' is not defined in the term set "
+                f"(labels: {', '.join(self.labels)})"
+            )
+        self.groups = {f"t{i}": label for i, label in enumerate(self.labels)}
+
+        alternation = "|".join(
+            f"(?P<t{i}>{'|'.join(self.terms[label])})" for i, label in enumerate(self.labels)
+        )
+        self.pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+        self.label_patterns = {
+            label: re.compile(rf"\b(?:{'|'.join(patterns)})\b", re.IGNORECASE)
+            for label, patterns in self.terms.items()
+        }
+        self.boundary_pattern = re.compile(r"[.!?]+(?=\s|$)")
+
+    def find(self, text):
+        return [
+            (self.groups[match.lastgroup], match.start(), match.end())
+            for match in self.pattern.finditer(text or "")
         ]
 
-        self.base_url = "https://www-scopus-com-ssl.oca.korea.ac.kr"
+    def hits(self, text):
+        spans = {}
+        for label, start, end in self.find(text):
+            spans.setdefault(label, []).append((start, end))
+        return spans
+
+    def labels_in(self, text):
+        return {self.groups[match.lastgroup] for match in self.pattern.finditer(text or "")}
+
+    def contains(self, text, label=None):
+        if label is None:
+            return self.pattern.search(text or "") is not None
+        return self.label_patterns[label].search(text or "") is not None
+
+    def sentence_spans(self, text):
+        spans = []
+        start = 0
+        for match in self.boundary_pattern.finditer(text):
+            word = text[start:match.start()].rsplit(None, 1)
+            word = word[-1].lstrip("([").lower() if word else ""
+            following = text[match.end():].lstrip()[:1]
+
+            if word in SENTENCE_ABBREVIATIONS or (len(word) == 1 and word.isalpha()):
+                continue
+            if following and following.islower():
+                continue
+
+            spans.append((start, match.end()))
+            start = match.end()
+
+        if text[start:].strip():
+            spans.append((start, len(text)))
+        return spans
+
+    def split_sentences(self, text):
+        return [text[start:end].strip() for start, end in self.sentence_spans(text or "")]
+
+    def sentences_with(self, text, label=None):
+        text = text or ""
+        hit_starts = [
+            start for hit_label, start, _ in self.find(text) if label is None or hit_label == label
+        ]
+
+        sentences = []
+        position = 0
+        for start, end in self.sentence_spans(text):
+            while position < len(hit_starts) and hit_starts[position] < start:
+                position += 1
+            if position < len(hit_starts) and hit_starts[position] < end:
+                sentence = text[start:end].strip().rstrip(".!?").strip()
+                if sentence:
+                    sentences.append(sentence)
+        return sentences
+
+    def classify_series(self, series, labels=None):
+        labels = labels or self.labels
+        found = [self.labels_in(text) for text in series.fillna("").astype(str)]
+        return pd.DataFrame(
+            [[label in hits for label in labels] for hits in found],
+            columns=labels,
+            index=series.index,
+            dtype=bool,
+        )
+
+
+def load_terms(path=None):
+    if not path:
+        return None
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def detect_sentences(matcher, title_text, abstract_text, label="LLM"):
+    detected_sentences = []
+    if title_text and matcher.contains(title_text, label):
+        title_sentences = " | ".join(matcher.sentences_with(title_text, label))
+        if title_sentences:
+            detected_sentences.append(f"Title: {title_sentences}")
+
+    if abstract_text and matcher.contains(abstract_text, label):
+        abstract_sentences = " | ".join(matcher.sentences_with(abstract_text, label))
+        if abstract_sentences:
+            detected_sentences.append(f"Abstract: {abstract_sentences}")
+
+    return " | ".join(detected_sentences)
+
+
+class PaperCache:
+    def __init__(self, path="scopus_paper_cache.sqlite3", ttl_days=30, max_entries=None):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400 if ttl_days else None
+        self.max_entries = max_entries
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS papers (
+                eid TEXT PRIMARY KEY,
+                link TEXT,
+                title TEXT,
+                abstract TEXT,
+                detailed_info TEXT,
+                fetched_at REAL
+            )
+            """
+        )
+        self.conn.commit()
+        self.evict()
+
+    def get(self, eid):
+        if not eid:
+            return None
+
+        row = self.conn.execute(
+            "SELECT detailed_info, fetched_at FROM papers WHERE eid = ?", (eid,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        detailed_info, fetched_at = row
+        if self.ttl_seconds and time.time() - fetched_at > self.ttl_seconds:
+            return None
+
+        return json.loads(detailed_info)
+
+    def put(self, eid, detailed_info):
+        if not eid:
+            return
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                eid,
+                detailed_info.get("link", ""),
+                detailed_info.get("title", ""),
+                detailed_info.get("abstract", ""),
+                json.dumps(detailed_info, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+        self.conn.commit()
+
+    def evict(self):
+        if self.ttl_seconds:
+            self.conn.execute(
+                "DELETE FROM papers WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+        if self.max_entries:
+            self.conn.execute(
+                """
+                DELETE FROM papers WHERE eid NOT IN (
+                    SELECT eid FROM papers ORDER BY fetched_at DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class PaperCorpus:
+    def __init__(self, path="scopus_corpus.sqlite3"):
+        self.path = path
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS corpus (
+                eid TEXT PRIMARY KEY,
+                link TEXT,
+                title TEXT,
+                abstract BLOB,
+                detailed_info BLOB,
+                keywords TEXT,
+                has_authors INTEGER,
+                visited_at REAL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def compress(self, value):
+        return zlib.compress(value.encode("utf-8"), 6)
+
+    def decompress(self, value):
+        return zlib.decompress(value).decode("utf-8") if value else ""
+
+    def put(self, eid, detailed_info, keyword=None, prefer_new=False):
+        if not eid:
+            return
+
+        detailed_info = {
+            field: value for field, value in detailed_info.items() if field != "paper_number"
+        }
+
+        row = self.conn.execute(
+            "SELECT abstract, detailed_info, keywords, has_authors FROM corpus WHERE eid = ?",
+            (eid,),
+        ).fetchone()
+
+        keywords = json.loads(row[2]) if row else []
+        for paper_keyword in list(detailed_info.get("keywords") or []) + [keyword]:
+            if paper_keyword and paper_keyword not in keywords:
+                keywords.append(paper_keyword)
+
+        has_authors = bool(detailed_info.get("authors"))
+        if row and not prefer_new:
+            stored_has_authors = bool(row[3])
+            stored_longer = len(self.decompress(row[0])) > len(detailed_info.get("abstract") or "")
+            if (stored_has_authors and not has_authors) or (
+                stored_has_authors == has_authors and stored_longer
+            ):
+                detailed_info = json.loads(self.decompress(row[1]))
+                has_authors = stored_has_authors
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO corpus VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                eid,
+                detailed_info.get("link", ""),
+                detailed_info.get("title", ""),
+                self.compress(detailed_info.get("abstract") or ""),
+                self.compress(json.dumps(detailed_info, ensure_ascii=False)),
+                json.dumps(keywords, ensure_ascii=False),
+                int(has_authors),
+                time.time(),
+            ),
+        )
+        self.conn.commit()
+
+    def get(self, eid):
+        row = self.conn.execute(
+            "SELECT detailed_info, keywords FROM corpus WHERE eid = ?", (eid,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        detailed_info = json.loads(self.decompress(row[0]))
+        detailed_info["keywords"] = json.loads(row[1])
+        return detailed_info
+
+    def set_keywords(self, eid, keywords):
+        self.conn.execute(
+            "UPDATE corpus SET keywords = ? WHERE eid = ?",
+            (json.dumps(list(keywords), ensure_ascii=False), eid),
+        )
+        self.conn.commit()
+
+    def papers(self):
+        for eid, detailed_info, keywords, has_authors in self.conn.execute(
+            "SELECT eid, detailed_info, keywords, has_authors FROM corpus ORDER BY visited_at"
+        ):
+            paper = json.loads(self.decompress(detailed_info))
+            paper["eid"] = eid
+            paper["keywords"] = json.loads(keywords)
+            paper["has_authors"] = bool(has_authors)
+            yield paper
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM corpus").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class PageArchive:
+    def __init__(self, path="scopus_pages.zst", level=10):
+        if zstandard is None:
+            raise ImportError("zstandard is required to archive detail pages")
+
+        self.path = path
+        self.index_path = f"{path}.index.sqlite3"
+        self.compressor = zstandard.ZstdCompressor(level=level)
+        self.lock = threading.Lock()
+
+        self.file = open(path, "ab")
+        self.conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                eid TEXT,
+                link TEXT,
+                offset INTEGER,
+                length INTEGER,
+                archived_at REAL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS pages_eid ON pages (eid)")
+        self.conn.commit()
+
+    def append(self, eid, link, html):
+        frame = self.compressor.compress(html.encode("utf-8"))
+
+        with self.lock:
+            self.file.seek(0, os.SEEK_END)
+            offset = self.file.tell()
+            self.file.write(frame)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+            self.conn.execute(
+                "INSERT INTO pages (eid, link, offset, length, archived_at) VALUES (?, ?, ?, ?, ?)",
+                (eid, link, offset, len(frame), time.time()),
+            )
+            self.conn.commit()
+
+    def entries(self):
+        with self.lock:
+            return self.conn.execute(
+                """
+                SELECT eid, link, offset, length FROM pages
+                WHERE id IN (SELECT MAX(id) FROM pages GROUP BY eid)
+                ORDER BY id
+                """
+            ).fetchall()
+
+    def close(self):
+        self.file.close()
+        self.conn.close()
+
+
+def read_archived_page(f, offset, length):
+    f.seek(offset)
+    return zstandard.ZstdDecompressor().decompress(f.read(length)).decode("utf-8")
+
+
+class RateGovernor:
+    def __init__(
+        self,
+        path="scopus_rate_governor.sqlite3",
+        initial_rate=0.3,
+        min_rate=0.05,
+        max_rate=2.0,
+        burst=3,
+        additive_increase=0.02,
+        multiplicative_decrease=0.5,
+        target_latency=8.0,
+    ):
+        self.path = path
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.target_latency = target_latency
+
+        conn = self.connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS governor (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    rate REAL,
+                    tokens REAL,
+                    updated_at REAL
+                )
+                """
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO governor VALUES (1, ?, ?, ?)",
+                (initial_rate, 1.0, time.time()),
+            )
+        finally:
+            conn.close()
+
+    def connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def acquire(self):
+        while True:
+            conn = self.connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                rate, tokens, updated_at = conn.execute(
+                    "SELECT rate, tokens, updated_at FROM governor WHERE id = 1"
+                ).fetchone()
+
+                now = time.time()
+                tokens = min(self.burst, tokens + (now - updated_at) * rate)
+
+                if tokens >= 1:
+                    conn.execute(
+                        "UPDATE governor SET tokens = ?, updated_at = ? WHERE id = 1",
+                        (tokens - 1, now),
+                    )
+                    conn.execute("COMMIT")
+                    return
+
+                conn.execute(
+                    "UPDATE governor SET tokens = ?, updated_at = ? WHERE id = 1",
+                    (tokens, now),
+                )
+                conn.execute("COMMIT")
+                wait = (1 - tokens) / rate
+            finally:
+                conn.close()
+
+            time.sleep(wait + random.uniform(0, 0.2))
+
+    def record(self, latency=None, timed_out=False, error=False, blocked=False):
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            (rate,) = conn.execute("SELECT rate FROM governor WHERE id = 1").fetchone()
+
+            if blocked or timed_out or error or (
+                latency is not None and latency > self.target_latency
+            ):
+                new_rate = max(self.min_rate, rate * self.multiplicative_decrease)
+            else:
+                new_rate = min(self.max_rate, rate + self.additive_increase)
+
+            conn.execute("UPDATE governor SET rate = ? WHERE id = 1", (new_rate,))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        if new_rate < rate:
+            logger.info(f"Rate governor slowed down: {rate:.3f} -> {new_rate:.3f} pages/s")
+
+        return new_rate
+
+    def current_rate(self):
+        conn = self.connect()
+        try:
+            (rate,) = conn.execute("SELECT rate FROM governor WHERE id = 1").fetchone()
+        finally:
+            conn.close()
+        return rate
+
+
+class CrawlJournal:
+    def __init__(self, path="scopus_journal.jsonl"):
+        self.path = path
+        self.file = None
+
+    def open(self, resume=False):
+        if not resume and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            rotated = f"{self.path}.{time.strftime('%Y%m%d-%H%M%S')}"
+            os.replace(self.path, rotated)
+            logger.info(f"Previous journal moved to {rotated}")
+
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def append(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping truncated journal line")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class ResultSink:
+    LIST_FIELDS = [
+        "authors",
+        "emails",
+        "detailed_affiliations",
+        "raw_affiliations",
+        "universities",
+        "countries",
+        "keywords",
+        "author_keywords",
+        "index_keywords",
+    ]
+    FIELDS = [
+        "keyword",
+        "paper_number",
+        "link",
+        "title",
+        "abstract",
+        "detected_sentences",
+    ] + LIST_FIELDS
+
+    def __init__(self, path, flush_every=20, flush_interval=30):
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.time()
+        self.opened = False
+
+    def rotate(self):
+        if os.path.exists(self.path):
+            rotated = f"{self.path}.{time.strftime('%Y%m%d-%H%M%S')}"
+            os.replace(self.path, rotated)
+            logger.info(f"Previous results moved to {rotated}")
+
+    def encode(self, keyword, detailed_info):
+        row = {"keyword": keyword}
+        for field in self.FIELDS[1:]:
+            value = detailed_info.get(field, [] if field in self.LIST_FIELDS else "")
+            if field in self.LIST_FIELDS:
+                value = json.dumps(value, ensure_ascii=False)
+            elif field == "paper_number":
+                value = str(value)
+            row[field] = value if value is not None else ""
+        return row
+
+    def decode(self, row):
+        detailed_info = {}
+        for field in self.FIELDS[1:]:
+            value = row.get(field, "")
+            if field in self.LIST_FIELDS:
+                value = json.loads(value) if value else []
+            elif field == "paper_number":
+                value = int(value) if str(value).isdigit() else value
+            detailed_info[field] = "" if value is None else value
+        return detailed_info
+
+    def write(self, keyword, detailed_info):
+        self.buffer.append(self.encode(keyword, detailed_info))
+
+        if (
+            len(self.buffer) >= self.flush_every
+            or time.time() - self.last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.write_rows(self.buffer)
+            self.buffer = []
+        self.last_flush = time.time()
+
+    def read(self, keyword):
+        self.flush()
+        for row in self.read_rows(keyword):
+            yield self.decode(row)
+
+    def find(self, link):
+        self.flush()
+        for row in self.find_rows(link):
+            return self.decode(row)
+        return None
+
+    def count(self):
+        self.flush()
+        return self.count_rows()
+
+    def open(self, resume=False):
+        if not resume:
+            self.rotate()
+        self.open_store()
+        self.opened = True
+
+    def close(self):
+        if self.opened:
+            self.flush()
+            self.close_store()
+            self.opened = False
+
+    def open_store(self):
+        raise NotImplementedError
+
+    def close_store(self):
+        pass
+
+    def write_rows(self, rows):
+        raise NotImplementedError
+
+    def read_rows(self, keyword):
+        raise NotImplementedError
+
+    def find_rows(self, link):
+        raise NotImplementedError
+
+    def count_rows(self):
+        raise NotImplementedError
+
+
+class CsvResultSink(ResultSink):
+    def open_store(self):
+        new_file = not os.path.exists(self.path)
+        self.file = open(self.path, "a", encoding="utf-8-sig", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=self.FIELDS)
+        if new_file:
+            self.writer.writeheader()
+
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def read_rows(self, keyword):
+        with open(self.path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                if row["keyword"] == keyword:
+                    yield row
+
+    def find_rows(self, link):
+        with open(self.path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                if row["link"] == link:
+                    yield row
+
+    def count_rows(self):
+        with open(self.path, encoding="utf-8-sig", newline="") as f:
+            return sum(1 for _ in csv.DictReader(f))
+
+    def close_store(self):
+        self.file.close()
+
+
+class SqliteResultSink(ResultSink):
+    def open_store(self):
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        columns = ", ".join(f"{field} TEXT" for field in self.FIELDS)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, {columns})"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS results_keyword ON results (keyword)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS results_link ON results (link)")
+        self.conn.commit()
+
+    def write_rows(self, rows):
+        placeholders = ", ".join("?" for _ in self.FIELDS)
+        self.conn.executemany(
+            f"INSERT INTO results ({', '.join(self.FIELDS)}) VALUES ({placeholders})",
+            [[row[field] for field in self.FIELDS] for row in rows],
+        )
+        self.conn.commit()
+
+    def read_rows(self, keyword):
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(self.FIELDS)} FROM results WHERE keyword = ? ORDER BY id",
+            (keyword,),
+        )
+        for values in cursor:
+            yield dict(zip(self.FIELDS, values))
+
+    def find_rows(self, link):
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(self.FIELDS)} FROM results WHERE link = ? ORDER BY id LIMIT 1",
+            (link,),
+        )
+        for values in cursor:
+            yield dict(zip(self.FIELDS, values))
+
+    def count_rows(self):
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close_store(self):
+        self.conn.close()
+
+
+class ParquetResultSink(ResultSink):
+    def open_store(self):
+        os.makedirs(self.path, exist_ok=True)
+        self.part = len(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def write_rows(self, rows):
+        self.part += 1
+        pd.DataFrame(rows, columns=self.FIELDS).to_parquet(
+            os.path.join(self.path, f"part-{self.part:05d}.parquet"), index=False
+        )
+
+    def iter_parts(self):
+        for part_path in sorted(glob.glob(os.path.join(self.path, "part-*.parquet"))):
+            yield pd.read_parquet(part_path)
+
+    def read_rows(self, keyword):
+        for df in self.iter_parts():
+            for row in df[df["keyword"] == keyword].to_dict("records"):
+                yield row
+
+    def find_rows(self, link):
+        for df in self.iter_parts():
+            for row in df[df["link"] == link].to_dict("records"):
+                yield row
+
+    def count_rows(self):
+        return sum(len(df) for df in self.iter_parts())
+
+
+RESULT_SINKS = {
+    "csv": (CsvResultSink, "scopus_results.csv"),
+    "sqlite": (SqliteResultSink, "scopus_results.sqlite3"),
+    "parquet": (ParquetResultSink, "scopus_results_parquet"),
+}
+
+
+def create_result_sink(sink_format, path=None, **kwargs):
+    if sink_format not in RESULT_SINKS:
+        raise ValueError(f"Unknown result sink: {sink_format}")
+
+    sink_class, default_path = RESULT_SINKS[sink_format]
+    return sink_class(path or default_path, **kwargs)
+
+
+EXPORT_COLUMNS = [
+    ("Paper Number", None),
+    ("Author", "authors"),
+    ("Email", "emails"),
+    ("Affiliation (Raw)", "raw_affiliations"),
+    ("Affiliation (Department)", "detailed_affiliations"),
+    ("Affiliation (University)", "universities"),
+    ("Affiliation (Country)", "countries"),
+    ("Detected Sentences", "detected_sentences"),
+    ("Paper Link", "link"),
+]
+
+EXPORT_LIST_FIELDS = [
+    "authors",
+    "emails",
+    "raw_affiliations",
+    "detailed_affiliations",
+    "universities",
+    "countries",
+]
+
+
+def format_papers_frame(papers, start_index=1):
+    papers = list(papers)
+    columns = [column for column, _ in EXPORT_COLUMNS]
+    if not papers:
+        return pd.DataFrame(columns=columns)
+
+    lists = {
+        field: [list(paper.get(field, [""])) for paper in papers]
+        for field in EXPORT_LIST_FIELDS
+    }
+    lengths = pd.DataFrame(
+        {field: [len(values) for values in lists[field]] for field in EXPORT_LIST_FIELDS}
+    ).max(axis=1)
+
+    def first_row_only(values):
+        return [
+            ([value] + [""] * (length - 1) if length else []) + [""]
+            for value, length in zip(values, lengths)
+        ]
+
+    def padded(field):
+        return [
+            values + [""] * (length - len(values) + 1)
+            for values, length in zip(lists[field], lengths)
+        ]
+
+    frame = pd.DataFrame(
+        {
+            column: (
+                first_row_only(range(start_index, start_index + len(papers)))
+                if field is None
+                else padded(field)
+                if field in lists
+                else first_row_only(paper.get(field, "") for paper in papers)
+            )
+            for column, field in EXPORT_COLUMNS
+        }
+    )
+
+    return frame.explode(columns, ignore_index=True).fillna("")
+
+
+def iter_papers_frames(papers, start_index=1, chunk_size=1000):
+    chunk = []
+    for paper in papers:
+        chunk.append(paper)
+        if len(chunk) >= chunk_size:
+            yield format_papers_frame(chunk, start_index)
+            start_index += len(chunk)
+            chunk = []
+
+    if chunk:
+        yield format_papers_frame(chunk, start_index)
+
+
+def unique_sheet_name(keyword, used):
+    base = re.sub(r"[^\w\s-]", "", keyword).strip()[:31] or "Sheet"
+    name = base
+    suffix = 2
+    while name.lower() in used:
+        tail = f" ({suffix})"
+        name = base[: 31 - len(tail)] + tail
+        suffix += 1
+
+    used.add(name.lower())
+    return name
+
+
+def write_excel_sheets(filename, sheets):
+    if xlsxwriter is None:
+        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
+            for sheet_name, frames in sheets:
+                if isinstance(frames, pd.DataFrame):
+                    frames = [frames]
+
+                row_index = 0
+                for df in frames:
+                    df.to_excel(
+                        writer,
+                        sheet_name=sheet_name,
+                        index=False,
+                        header=not row_index,
+                        startrow=row_index,
+                    )
+                    row_index += len(df) + (0 if row_index else 1)
+        return
+
+    workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
+    try:
+        for sheet_name, frames in sheets:
+            if isinstance(frames, pd.DataFrame):
+                frames = [frames]
+
+            worksheet = None
+            row_index = 0
+            for df in frames:
+                if worksheet is None:
+                    worksheet = workbook.add_worksheet(sheet_name)
+                    worksheet.write_row(0, 0, list(df.columns))
+                for row in df.itertuples(index=False, name=None):
+                    row_index += 1
+                    worksheet.write_row(row_index, 0, row)
+    finally:
+        workbook.close()
+
+
+def css_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def element_text(element):
+    if element is None:
+        return None
+    return " ".join(element.text_content().split())
+
+
+def parse_detail_html(html):
+    if lxml is None:
+        raise ImportError("lxml is required to parse detail pages without a browser")
+
+    tree = lxml.html.fromstring(html)
+
+    title = tree.xpath("//h2[@data-testid='publication-titles']")
+    abstract = tree.xpath("//div[@id='document-details-abstract']")
+
+    affiliations = []
+    for li in tree.xpath(
+        "//section[@data-testid='detailed-information-affiliations']"
+        f"//ul[{css_class('DetailedInformationFlyout_list__76Ipn')}]//li"
+    ):
+        sup = li.find(".//sup")
+        span = li.find(".//span")
+        affiliations.append(
+            {
+                "sup": element_text(sup) if sup is not None and span is not None else None,
+                "span": element_text(span) if sup is not None and span is not None else None,
+                "text": element_text(li),
+            }
+        )
+
+    authors = []
+    for li in tree.xpath(
+        f"//ul[{css_class('DetailedInformationFlyout_list__76Ipn')}]"
+        "//li[@data-testid='authorItem-button']"
+    ):
+        names = li.xpath(f".//span[{css_class('Button_text__0dddp')}]")
+        name_element = names[0] if names else None
+
+        email = ""
+        node = name_element
+        while node is not None and not email:
+            if node.tag == "li":
+                mailto = node.xpath(".//a[starts-with(@href, 'mailto:')]")
+                if mailto:
+                    email = mailto[0].get("href")
+            node = node.getparent()
+
+        authors.append(
+            {
+                "name": element_text(name_element),
+                "sups": [
+                    element_text(sup)
+                    for sup in li.xpath(f".//sup[{css_class('AuthorList_affiliation__bTM3u')}]")
+                ],
+                "email": email,
+            }
+        )
+
+    keywords = [
+        element_text(span)
+        for span in tree.xpath(
+            "//section[@id='author-keywords' or @data-testid='author-keywords']//span"
+        )
+    ]
+    index_keywords = [
+        element_text(span)
+        for span in tree.xpath(
+            "//section[@id='indexed-keywords' or @data-testid='indexed-keywords']//span"
+        )
+    ]
+
+    return (
+        element_text(title[0]) if title else "",
+        element_text(abstract[0]) if abstract else "",
+        {
+            "affiliations": affiliations,
+            "authors": authors,
+            "keywords": [keyword for keyword in keywords if keyword],
+            "index_keywords": [keyword for keyword in index_keywords if keyword],
+        },
+    )
+
+
+class HttpFetcher:
+    def __init__(
+        self,
+        cookies=None,
+        user_agent=None,
+        concurrency=4,
+        timeout=20,
+        rate_governor=None,
+    ):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.rate_governor = rate_governor
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        return cls(
+            cookies=driver.get_cookies(),
+            user_agent=driver.execute_script("return navigator.userAgent"),
+            **kwargs,
+        )
+
+    def fetch(self, url):
+        if self.rate_governor:
+            self.rate_governor.acquire()
+
+        started_at = time.time()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.Timeout:
+            if self.rate_governor:
+                self.rate_governor.record(timed_out=True)
+            logger.warning(f"HTTP fetch timed out: {url}")
+            return None
+        except requests.RequestException as e:
+            if self.rate_governor:
+                self.rate_governor.record(error=True)
+            logger.warning(f"HTTP fetch failed: {url} ({str(e)})")
+            return None
+
+        redirected = urlparse(response.url).hostname != urlparse(url).hostname
+        failed = response.status_code != 200 or redirected
+        if self.rate_governor:
+            self.rate_governor.record(
+                latency=time.time() - started_at,
+                error=failed,
+                blocked=response.status_code in (403, 429),
+            )
+
+        if failed:
+            logger.warning(f"HTTP fetch got status {response.status_code} from {response.url}")
+            return None
+
+        return response.text
+
+    def fetch_many(self, urls):
+        return list(self.executor.map(self.fetch, urls))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+
+class AsyncFetchEngine:
+    def __init__(
+        self,
+        cookies=None,
+        user_agent=None,
+        concurrency=16,
+        per_host_limit=8,
+        timeout=20,
+        retries=3,
+        backoff=1.0,
+        rate_governor=None,
+    ):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async fetch backend")
+
+        self.cookies = cookies or []
+        self.user_agent = user_agent
+        self.concurrency = concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_governor = rate_governor
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        return cls(
+            cookies=driver.get_cookies(),
+            user_agent=driver.execute_script("return navigator.userAgent"),
+            **kwargs,
+        )
+
+    def create_session(self):
+        headers = {
+            "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.concurrency, limit_per_host=self.per_host_limit
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=headers,
+        )
+        for cookie in self.cookies:
+            session.cookie_jar.update_cookies(
+                {cookie["name"]: cookie["value"]},
+                response_url=aiohttp.client.URL(
+                    f"https://{cookie.get('domain', '').lstrip('.')}{cookie.get('path', '/')}"
+                ),
+            )
+        return session
+
+    async def fetch(self, session, semaphore, url):
+        for attempt in range(1, self.retries + 1):
+            async with semaphore:
+                if self.rate_governor:
+                    await asyncio.to_thread(self.rate_governor.acquire)
+
+                started_at = time.time()
+                try:
+                    async with session.get(url) as response:
+                        text = await response.text()
+                        redirected = response.url.host != urlparse(url).hostname
+                        failed = response.status != 200 or redirected
+                        if self.rate_governor:
+                            await asyncio.to_thread(
+                                self.rate_governor.record,
+                                latency=time.time() - started_at,
+                                error=failed,
+                                blocked=response.status in (403, 429),
+                            )
+                        if not failed:
+                            return text
+                        if response.status not in (429, 500, 502, 503, 504):
+                            logger.warning(f"Async fetch got status {response.status} from {url}")
+                            return None
+                except asyncio.TimeoutError:
+                    if self.rate_governor:
+                        await asyncio.to_thread(self.rate_governor.record, timed_out=True)
+                except aiohttp.ClientError as e:
+                    if self.rate_governor:
+                        await asyncio.to_thread(self.rate_governor.record, error=True)
+                    logger.warning(f"Async fetch failed: {url} ({str(e)})")
+
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1) + random.uniform(0, self.backoff))
+
+        logger.warning(f"Async fetch gave up after {self.retries} attempts: {url}")
+        return None
+
+    async def stream(self, link_source, parse):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = asyncio.Queue(maxsize=self.concurrency * 4)
+        iterator = iter(link_source)
+
+        async def produce(session):
+            try:
+                while True:
+                    paper_link = await asyncio.to_thread(next, iterator, None)
+                    if paper_link is None:
+                        break
+                    task = asyncio.create_task(self.fetch(session, semaphore, paper_link))
+                    await pending.put((paper_link, task))
+            finally:
+                await pending.put(None)
+
+        async with self.create_session() as session:
+            producer = asyncio.create_task(produce(session))
+            in_flight = []
+            try:
+                while True:
+                    item = await pending.get()
+                    if item is None:
+                        break
+                    in_flight.append(item[1])
+                    paper_link, task = item
+                    html = await task
+                    in_flight.remove(task)
+                    yield paper_link, parse(paper_link, html) if html else None
+                await producer
+            finally:
+                producer.cancel()
+                while not pending.empty():
+                    item = pending.get_nowait()
+                    if item:
+                        in_flight.append(item[1])
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(producer, *in_flight, return_exceptions=True)
+
+    async def collect(self, urls):
+        return [html async for _, html in self.stream(urls, lambda paper_link, html: html)]
+
+    def fetch_many(self, urls):
+        return asyncio.run(self.collect(urls))
+
+    def open_stream(self, parse):
+        return FetchStream(self, parse)
+
+    def close(self):
+        pass
+
+
+class FetchStream:
+    def __init__(self, engine, parse):
+        self.links = queue.Queue()
+        self.results = queue.Queue()
+        self.stopped = False
+        self.loop = None
+        self.task = None
+        self.thread = threading.Thread(target=self.run, args=(engine, parse), daemon=True)
+        self.thread.start()
+
+    def run(self, engine, parse):
+        async def consume():
+            self.loop = asyncio.get_running_loop()
+            self.task = asyncio.current_task()
+            async for paper_link, detailed_info in engine.stream(iter(self.links.get, None), parse):
+                self.results.put((paper_link, detailed_info))
+
+        try:
+            asyncio.run(consume())
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Async fetch stream stopped: {str(e)}")
+        finally:
+            self.results.put(None)
+
+    def submit(self, paper_links):
+        for paper_link in paper_links:
+            self.links.put(paper_link)
+
+    def collect(self, count):
+        collected = []
+        while len(collected) < count:
+            item = None if self.stopped else self.results.get()
+            if item is None:
+                self.stopped = True
+            collected.append(item[1] if item else None)
+        return collected
+
+    def close(self):
+        self.links.put(None)
+        if self.loop and self.task:
+            try:
+                self.loop.call_soon_threadsafe(self.task.cancel)
+            except RuntimeError:
+                pass
+        self.thread.join()
+
+
+HISTOGRAM_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 30, 60, 120]
+
+
+class CrawlMetrics:
+    def __init__(
+        self,
+        json_path="scopus_metrics.json",
+        prometheus_path="scopus_metrics.prom",
+        export_interval=30,
+    ):
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self.export_interval = export_interval
+        self.started_at = time.time()
+        self.last_export = 0.0
+        self.phases = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def observe(self, phase, seconds):
+        with self.lock:
+            stats = self.phases.setdefault(
+                phase,
+                {
+                    "count": 0,
+                    "sum": 0.0,
+                    "min": None,
+                    "max": 0.0,
+                    "buckets": [0] * len(HISTOGRAM_BUCKETS),
+                },
+            )
+            stats["count"] += 1
+            stats["sum"] += seconds
+            stats["min"] = seconds if stats["min"] is None else min(stats["min"], seconds)
+            stats["max"] = max(stats["max"], seconds)
+            for i, bound in enumerate(HISTOGRAM_BUCKETS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+
+    def increment(self, counter, value=1):
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def summary(self):
+        with self.lock:
+            phases = {}
+            for phase, stats in self.phases.items():
+                phases[phase] = {
+                    "count": stats["count"],
+                    "total_seconds": stats["sum"],
+                    "mean_seconds": stats["sum"] / stats["count"] if stats["count"] else 0,
+                    "min_seconds": stats["min"],
+                    "max_seconds": stats["max"],
+                    "buckets": dict(
+                        zip([str(bound) for bound in HISTOGRAM_BUCKETS], stats["buckets"])
+                    ),
+                }
+
+            return {
+                "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "elapsed_seconds": time.time() - self.started_at,
+                "phases": phases,
+                "counters": dict(self.counters),
+            }
+
+    def prometheus_text(self):
+        with self.lock:
+            lines = [
+                "# HELP scopus_phase_seconds Time spent in crawler phases.",
+                "# TYPE scopus_phase_seconds histogram",
+            ]
+            for phase, stats in sorted(self.phases.items()):
+                for bound, count in zip(HISTOGRAM_BUCKETS, stats["buckets"]):
+                    lines.append(f'scopus_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}')
+                lines.append(f'scopus_phase_seconds_bucket{{phase="{phase}",le="+Inf"}} {stats["count"]}')
+                lines.append(f'scopus_phase_seconds_sum{{phase="{phase}"}} {stats["sum"]:.6f}')
+                lines.append(f'scopus_phase_seconds_count{{phase="{phase}"}} {stats["count"]}')
+
+            lines.append("# HELP scopus_events_total Crawler event counters.")
+            lines.append("# TYPE scopus_events_total counter")
+            for counter, value in sorted(self.counters.items()):
+                lines.append(f'scopus_events_total{{event="{counter}"}} {value}')
+
+            lines.append("# HELP scopus_elapsed_seconds Seconds since the crawl started.")
+            lines.append("# TYPE scopus_elapsed_seconds gauge")
+            lines.append(f"scopus_elapsed_seconds {time.time() - self.started_at:.3f}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_atomic(self, path, text):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    def export(self):
+        try:
+            if self.json_path:
+                self.write_atomic(self.json_path, json.dumps(self.summary(), indent=2))
+            if self.prometheus_path:
+                self.write_atomic(self.prometheus_path, self.prometheus_text())
+        except OSError as e:
+            logger.warning(f"Failed to export metrics: {str(e)}")
+
+        self.last_export = time.time()
+
+    def maybe_export(self):
+        if time.time() - self.last_export >= self.export_interval:
+            self.export()
+
+
+def timed(phase):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.metrics.observe(phase, time.perf_counter() - started_at)
+
+        return wrapper
+
+    return decorator
+
+
+class DriverCommandTracer:
+    def __init__(self, driver, budgets=None):
+        self.driver = driver
+        self.budgets = dict(budgets or {})
+        self.stats = {}
+        self.command_counts = {}
+        self.last_report = {}
+        self.violations = []
+        self.method_names = {
+            name for name, value in vars(ScopusCrawler).items() if callable(value)
+        }
+        self.lock = threading.Lock()
+
+        self.execute = driver.execute
+        driver.execute = self.traced_execute
+
+    def uninstall(self):
+        self.driver.execute = self.execute
+
+    def caller_methods(self):
+        methods = []
+        frame = sys._getframe(2)
+        while frame is not None:
+            name = frame.f_code.co_name
+            if (
+                name in self.method_names
+                and name not in methods
+                and isinstance(frame.f_locals.get("self"), ScopusCrawler)
+            ):
+                methods.append(name)
+            frame = frame.f_back
+
+        return methods or ["<driver>"]
+
+    def traced_execute(self, driver_command, params=None):
+        started_at = time.perf_counter()
+        try:
+            return self.execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            methods = self.caller_methods()
+            with self.lock:
+                self.command_counts[driver_command] = self.command_counts.get(driver_command, 0) + 1
+                for method in methods:
+                    stats = self.stats.setdefault(method, {"commands": 0, "seconds": 0.0})
+                    stats["commands"] += 1
+                    stats["seconds"] += elapsed
+
+    def snapshot(self):
+        with self.lock:
+            return {method: dict(stats) for method, stats in self.stats.items()}
+
+    def report(self, since=None):
+        since = since or {}
+        report = {}
+        for method, stats in self.snapshot().items():
+            previous = since.get(method, {"commands": 0, "seconds": 0.0})
+            commands = stats["commands"] - previous["commands"]
+            if commands:
+                report[method] = {
+                    "commands": commands,
+                    "seconds": stats["seconds"] - previous["seconds"],
+                }
+
+        return report
+
+    def format_report(self, report):
+        ordered = sorted(report.items(), key=lambda item: item[1]["commands"], reverse=True)
+        return "; ".join(
+            f"{method}: {stats['commands']} commands, {stats['seconds']:.1f} s protocol time"
+            for method, stats in ordered
+        )
+
+    def check_budgets(self, report):
+        for method, budget in self.budgets.items():
+            commands = report.get(method, {}).get("commands", 0)
+            if commands > budget:
+                message = f"{method} issued {commands} WebDriver commands (budget {budget})"
+                self.violations.append(message)
+                raise AssertionError(message)
+
+
+def traced_commands(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        tracer = self.command_tracer
+        if tracer is None:
+            return method(self, *args, **kwargs)
+
+        snapshot = tracer.snapshot()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            tracer.last_report = tracer.report(snapshot)
+            logger.info(f"WebDriver commands: {tracer.format_report(tracer.last_report)}")
+            tracer.check_budgets(tracer.last_report)
+
+    return wrapper
+
+
+class ScopusCrawler:
+    def __init__(
+        self,
+        start_keyword_index=0,
+        start_page=1,
+        num_workers=1,
+        cache_path="scopus_paper_cache.sqlite3",
+        cache_ttl_days=30,
+        refresh=False,
+        prefilter_mode="defer",
+        politeness_floor=None,
+        rate_governor_path="scopus_rate_governor.sqlite3",
+        journal_path="scopus_journal.jsonl",
+        resume=False,
+        results_per_page=10,
+        max_results=2000,
+        max_page_failures=3,
+        max_session_resets=2,
+        consolidate_queries=False,
+        max_query_length=1000,
+        topic_terms=None,
+        filter_term="LLM",
+        corpus_path="scopus_corpus.sqlite3",
+        archive_path=None,
+        sink_format="sqlite",
+        sink_path=None,
+        headless=False,
+        block_resources=False,
+        block_css=False,
+        measure_bytes=False,
+        reuse_detail_tab=True,
+        profile_dir=None,
+        chromedriver_path=None,
+        chromedriver_cache_file=".chromedriver_path.json",
+        fetch_backend="browser",
+        http_concurrency=4,
+        base_url="https://www-scopus-com-ssl.oca.korea.ac.kr",
+        metrics_json_path="scopus_metrics.json",
+        metrics_prometheus_path="scopus_metrics.prom",
+        trace_commands=False,
+        command_budgets=None,
+    ):
+        self.keywords = list(DEFAULT_KEYWORDS)
+
+        self.base_url = base_url
         self.library_url = "https://libs.korea.ac.kr/"
         self.driver = None
         self.results_data = {}
 
         self.start_keyword_index = start_keyword_index
         self.start_page = start_page
+        self.requested_results_per_page = results_per_page
+        self.results_per_page = results_per_page
+        self.max_results = max_results
+        self.max_page_failures = max_page_failures
+        self.max_session_resets = max_session_resets
+        self.consolidate_queries = consolidate_queries
+        self.max_query_length = max_query_length
+
+        self.queries = list(self.keywords)
+        self.query_result_limits = {}
+
+        self.term_matcher = TermMatcher(topic_terms, filter_term)
+        self.filter_term = filter_term
+
+        self.num_workers = max(1, int(num_workers))
+        self.workers = []
+        self.worker_queue = None
+        self.worker_executor = None
+
+        self.cache_path = cache_path
+        self.cache_ttl_days = cache_ttl_days
+        self.corpus_path = corpus_path
+        self.archive_path = archive_path
+        self.cache = None
+        self.corpus = None
+        self.page_archive = None
+        self.refresh = refresh
+
+        self.seen_papers = set()
+        self.duplicate_skips = 0
+
+        if prefilter_mode not in ("off", "title", "defer"):
+            raise ValueError(f"Unknown prefilter mode: {prefilter_mode}")
+        self.prefilter_mode = prefilter_mode
+        self.prefilter_skips = 0
+
+        self.politeness_floor = politeness_floor
+        self.last_page_load = 0.0
+
+        self.rate_governor_path = rate_governor_path
+        self.rate_governor = None
+
+        if sink_format and sink_format not in RESULT_SINKS:
+            raise ValueError(f"Unknown result sink: {sink_format}")
+        self.journal_path = journal_path
+        self.sink_format = sink_format
+        self.sink_path = sink_path
+        self.journal = None
+        self.sink = None
+
+        self.headless = headless
+        self.block_resources = block_resources
+        self.block_css = block_css
+        self.measure_bytes = measure_bytes
+        self.bytes_transferred = 0
+
+        self.reuse_detail_tab = reuse_detail_tab
+
+        self.profile_dir = profile_dir
+        self.chromedriver_path = chromedriver_path
+        self.chromedriver_cache_file = chromedriver_cache_file
+
+        if fetch_backend not in ("browser", "http", "async"):
+            raise ValueError(f"Unknown fetch backend: {fetch_backend}")
+        self.fetch_backend = fetch_backend
+        self.http_concurrency = http_concurrency
+        self.http_fetcher = None
+        self.fetch_stream = None
+
+        self.metrics = CrawlMetrics(metrics_json_path, metrics_prometheus_path)
+
+        self.trace_commands = trace_commands
+        self.command_budgets = command_budgets
+        self.command_tracer = None
+        self.results_handle = None
+        self.detail_handle = None
+
+        self.resume = resume
+
+    def open_stores(self):
+        if self.cache_path:
+            self.cache = PaperCache(self.cache_path, ttl_days=self.cache_ttl_days)
+        if self.corpus_path:
+            self.corpus = PaperCorpus(self.corpus_path)
+        if self.archive_path:
+            self.page_archive = PageArchive(self.archive_path)
+        if self.rate_governor_path:
+            self.rate_governor = RateGovernor(self.rate_governor_path)
+        if self.journal_path:
+            self.journal = CrawlJournal(self.journal_path)
+        if self.sink_format:
+            self.sink = create_result_sink(self.sink_format, self.sink_path)
 
     def setup_driver(self):
+        self.driver = self.create_driver(use_profile=True)
+        self.install_command_tracer()
+        logger.info("Chrome driver setup completed")
+
+    def resolve_chromedriver_path(self):
+        if self.chromedriver_path and os.path.exists(self.chromedriver_path):
+            return self.chromedriver_path
+
+        try:
+            with open(self.chromedriver_cache_file, encoding="utf-8") as f:
+                cached_path = json.load(f).get("path")
+            if cached_path and os.path.exists(cached_path):
+                self.chromedriver_path = cached_path
+                return cached_path
+        except (OSError, ValueError):
+            pass
+
+        self.chromedriver_path = ChromeDriverManager().install()
+        try:
+            with open(self.chromedriver_cache_file, "w", encoding="utf-8") as f:
+                json.dump({"path": self.chromedriver_path}, f)
+        except OSError as e:
+            logger.warning(f"Failed to cache chromedriver path: {str(e)}")
+
+        logger.info(f"Resolved chromedriver: {self.chromedriver_path}")
+        return self.chromedriver_path
+
+    def invalidate_chromedriver_cache(self):
+        self.chromedriver_path = None
+        try:
+            os.remove(self.chromedriver_cache_file)
+        except OSError:
+            pass
+
+    def install_command_tracer(self):
+        if self.trace_commands and self.driver:
+            self.command_tracer = DriverCommandTracer(self.driver, self.command_budgets)
+
+    def create_driver(self, use_profile=False):
         chrome_options = Options()
 
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -66,16 +2020,37 @@ class ScopusCrawler:
         )
 
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--start-maximized")
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+        else:
+            chrome_options.add_argument("--start-maximized")
+
+        if self.block_resources:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+
+        if self.measure_bytes:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        if use_profile and self.profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
 
-        self.driver.execute_script(
+        service = Service(self.resolve_chromedriver_path())
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except SessionNotCreatedException as e:
+            logger.warning(f"Cached chromedriver rejected, resolving a new one: {str(e)}")
+            self.invalidate_chromedriver_cache()
+            service = Service(self.resolve_chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
 
-        self.driver.execute_cdp_cmd(
+        driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
             {
                 "source": """
@@ -98,116 +2073,467 @@ class ScopusCrawler:
             },
         )
 
-        logger.info("Chrome driver setup completed")
+        self.apply_network_profile(driver)
 
-    def extract_author_affiliation_mapping(self):
-        author_affiliation_map = {}
-        affiliation_dict = {}
+        return driver
+
+    def apply_network_profile(self, driver=None):
+        if not self.block_resources:
+            return
+
+        driver = driver or self.driver
+        patterns = list(BLOCKED_URL_PATTERNS)
+        if self.block_css:
+            patterns.append("*.css")
 
         try:
-            affiliation_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "section[data-testid='detailed-information-affiliations'] ul.DetailedInformationFlyout_list__76Ipn li",
-            )
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.warning(f"Failed to apply resource blocking: {str(e)}")
 
-            for aff in affiliation_elements:
-                try:
-                    try:
-                        sup = aff.find_element(By.TAG_NAME, "sup").text.strip()
-                        text = aff.find_element(By.TAG_NAME, "span").text.strip()
-                        affiliation_dict[sup] = text
-                    except NoSuchElementException:
-                        text = aff.text.strip()
-                        if text:
-                            default_key = "default"
-                            counter = 1
-                            while default_key in affiliation_dict:
-                                default_key = f"default{counter}"
-                                counter += 1
-                            affiliation_dict[default_key] = text
-                except Exception:
-                    continue
+    def read_transferred_bytes(self):
+        if not self.measure_bytes:
+            return 0
 
-            author_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "ul.DetailedInformationFlyout_list__76Ipn li[data-testid='authorItem-button']",
+        transferred = 0
+        try:
+            for entry in self.driver.get_log("performance"):
+                message = json.loads(entry["message"])["message"]
+                if message.get("method") == "Network.loadingFinished":
+                    transferred += message["params"].get("encodedDataLength", 0)
+        except Exception:
+            return 0
+
+        self.bytes_transferred += transferred
+        self.metrics.increment("bytes_transferred", transferred)
+        return transferred
+
+    def log_page_bytes(self, paper_link):
+        if self.measure_bytes:
+            page_bytes = self.read_transferred_bytes()
+            self.metrics.increment("detail_pages_measured")
+            self.metrics.increment(
+                "detail_bytes_blocked" if self.block_resources else "detail_bytes_unblocked",
+                page_bytes,
             )
+            logger.info(f"Detail page transferred {page_bytes / 1024:.1f} KB: {paper_link}")
 
-            num_affiliations = len(affiliation_dict)
+    def setup_worker_pool(self):
+        if self.num_workers <= 1:
+            return
 
-            for i, author_el in enumerate(author_elements, 1):
-                try:
-                    name = author_el.find_element(
-                        By.CSS_SELECTOR, "span.Button_text__0dddp"
-                    ).text.strip()
+        cookies = self.driver.get_cookies()
+        current_url = self.driver.current_url
+        parsed_url = urlparse(current_url)
+        current_host = parsed_url.hostname or ""
+        host_root = f"{parsed_url.scheme}://{parsed_url.netloc}/"
+
+        self.worker_queue = queue.Queue()
 
-                    if not name or name.lower() in ["authors"] or name.startswith("+"):
+        for worker_id in range(1, self.num_workers + 1):
+            try:
+                worker = ScopusCrawler(
+                    start_keyword_index=self.start_keyword_index,
+                    start_page=self.start_page,
+                )
+                worker.base_url = self.base_url
+                worker.politeness_floor = self.politeness_floor
+                worker.rate_governor = self.rate_governor
+                worker.headless = self.headless
+                worker.block_resources = self.block_resources
+                worker.measure_bytes = self.measure_bytes
+                worker.block_css = self.block_css
+                worker.reuse_detail_tab = self.reuse_detail_tab
+                worker.chromedriver_path = self.chromedriver_path
+                worker.metrics = self.metrics
+                worker.page_archive = self.page_archive
+                worker.term_matcher = self.term_matcher
+                worker.filter_term = self.filter_term
+                worker.trace_commands = self.trace_commands
+                worker.command_budgets = self.command_budgets
+                worker.driver = self.create_driver()
+                worker.install_command_tracer()
+
+                worker.driver.get(host_root)
+                for cookie in cookies:
+                    domain = cookie.get("domain", "").lstrip(".")
+                    if domain and not current_host.endswith(domain):
+                        logger.warning(
+                            f"Skipping cookie '{cookie.get('name')}' for {domain}: "
+                            f"does not match {current_host}"
+                        )
                         continue
+                    cookie.pop("sameSite", None)
+                    try:
+                        worker.driver.add_cookie(cookie)
+                    except Exception:
+                        continue
+                worker.driver.get(current_url)
 
-                    superscripts = []
-                    sup_elements = author_el.find_elements(
-                        By.CSS_SELECTOR, "sup.AuthorList_affiliation__bTM3u"
-                    )
-                    for sup in sup_elements:
-                        val = sup.text.strip()
-                        for s in re.split(r"[,\s]+", val):
-                            if s:
-                                superscripts.append(s)
-
-                    if num_affiliations == 1:
-                        superscripts = list(affiliation_dict.keys())
-                    elif num_affiliations > 1:
-                        if not superscripts:
-                            first_affiliation = list(affiliation_dict.keys())[0] if affiliation_dict else ""
-                            if first_affiliation:
-                                superscripts = [first_affiliation]
-                            else:
-                                superscripts = []
-                    elif num_affiliations == 0:
-                        superscripts = []
-                    else:
-                        superscripts = []
+                self.workers.append(worker)
+                self.worker_queue.put(worker)
+                logger.info(f"Worker {worker_id}/{self.num_workers} session ready")
 
-                    author_affiliation_map[name] = superscripts
+            except Exception as e:
+                logger.warning(f"Failed to start worker {worker_id}: {str(e)}")
 
-                except Exception:
+        if self.workers:
+            self.worker_executor = ThreadPoolExecutor(max_workers=len(self.workers))
+        else:
+            logger.warning("No worker sessions available, falling back to single session")
+
+    def close_worker_pool(self):
+        if self.worker_executor:
+            self.worker_executor.shutdown(wait=True)
+            self.worker_executor = None
+
+        for worker in self.workers:
+            try:
+                worker.driver.quit()
+            except Exception:
+                pass
+
+        self.workers = []
+        self.worker_queue = None
+
+    def fetch_with_worker(self, paper_link):
+        worker = self.worker_queue.get()
+        try:
+            return worker.get_detailed_author_info(paper_link)
+        finally:
+            self.worker_queue.put(worker)
+
+    def recall_paper(self, key, paper_link):
+        if self.corpus:
+            detailed_info = self.corpus.get(key)
+            if detailed_info is not None:
+                return detailed_info
+
+        if self.cache:
+            detailed_info = self.cache.get(key)
+            if detailed_info is not None:
+                return detailed_info
+
+        if self.sink and self.sink.opened:
+            return self.sink.find(paper_link)
+
+        return None
+
+    def open_fetch_stream(self):
+        if isinstance(self.http_fetcher, AsyncFetchEngine):
+            self.fetch_stream = self.http_fetcher.open_stream(self.parse_fetched_page)
+
+    def close_fetch_stream(self):
+        if self.fetch_stream:
+            self.fetch_stream.close()
+            self.fetch_stream = None
+
+    def parse_fetched_page(self, paper_link, html):
+        try:
+            return self.get_detailed_author_info_from_html(paper_link, html)
+        except Exception as e:
+            logger.warning(f"Error parsing detail HTML: {str(e)}")
+            return None
+
+    def fetch_detailed_infos(self, paper_links, keyword=None):
+        return self.finish_detailed_infos(self.start_detailed_infos(paper_links), keyword)
+
+    def start_detailed_infos(self, paper_links):
+        keys = [parse_eid(paper_link) or paper_link for paper_link in paper_links]
+        known = {}
+
+        for key, paper_link in zip(keys, paper_links):
+            if key in self.seen_papers and key not in known:
+                detailed_info = self.recall_paper(key, paper_link)
+                if detailed_info is not None:
+                    known[key] = detailed_info
+
+        seen_hits = sum(1 for key in keys if key in known)
+        if seen_hits:
+            logger.info(f"Already fetched this run: {seen_hits}/{len(paper_links)}")
+            self.duplicate_skips += seen_hits
+            self.metrics.increment("duplicate_skips", seen_hits)
+
+        if self.cache and not self.refresh:
+            for key in keys:
+                if key not in known:
+                    detailed_info = self.cache.get(key)
+                    if detailed_info is not None:
+                        known[key] = detailed_info
+                        self.seen_papers.add(key)
+
+        missing = []
+        missing_keys = set()
+        for i, key in enumerate(keys):
+            if key not in known and key not in missing_keys:
+                missing.append(i)
+                missing_keys.add(key)
+
+        cache_hits = sum(1 for key in keys if key in known) - seen_hits
+        if self.cache and cache_hits:
+            logger.info(f"Paper cache hits: {cache_hits}/{len(paper_links)}")
+
+        missing_links = [paper_links[i] for i in missing]
+        if self.fetch_stream:
+            self.fetch_stream.submit(missing_links)
+
+        return {"keys": keys, "known": known, "missing": missing, "missing_links": missing_links}
+
+    def finish_detailed_infos(self, batch, keyword=None):
+        keys = batch["keys"]
+        known = batch["known"]
+        missing = batch["missing"]
+        missing_links = batch["missing_links"]
+        fetched = [None] * len(missing_links)
+
+        if self.fetch_stream:
+            fetched = self.fetch_stream.collect(len(missing_links))
+        elif self.http_fetcher:
+            pages = self.http_fetcher.fetch_many(missing_links)
+            for j, (paper_link, html) in enumerate(zip(missing_links, pages)):
+                if html:
+                    fetched[j] = self.parse_fetched_page(paper_link, html)
+
+        if self.http_fetcher:
+            fallback_count = fetched.count(None)
+            if fallback_count:
+                logger.info(f"HTTP fetch fell back to browser for {fallback_count} papers")
+
+        browser_indices = [j for j, info in enumerate(fetched) if info is None]
+        browser_links = [missing_links[j] for j in browser_indices]
+        if self.worker_executor:
+            browser_fetched = list(self.worker_executor.map(self.fetch_with_worker, browser_links))
+        else:
+            browser_fetched = []
+            for paper_link in browser_links:
+                browser_fetched.append(self.get_detailed_author_info(paper_link))
+
+        for j, detailed_info in zip(browser_indices, browser_fetched):
+            fetched[j] = detailed_info
+
+        for i, detailed_info in zip(missing, fetched):
+            known[keys[i]] = detailed_info
+            self.seen_papers.add(keys[i])
+            if self.cache and self.is_cacheable(detailed_info):
+                self.cache.put(keys[i], detailed_info)
+
+        detailed_infos = []
+        for key in keys:
+            detailed_info = known[key]
+            paper_keywords = detailed_info.setdefault("keywords", [])
+            if keyword and keyword not in paper_keywords:
+                paper_keywords.append(keyword)
+            detailed_infos.append(detailed_info)
+
+        return detailed_infos
+
+    def is_cacheable(self, detailed_info):
+        if not (detailed_info.get("title") or detailed_info.get("abstract")):
+            return False
+
+        if detailed_info.get("detected_sentences") == SKIPPED_SENTENCES:
+            return True
+
+        return bool(detailed_info.get("authors"))
+
+    def extract_page_payload(self):
+        try:
+            payload = self.driver.execute_script(AUTHOR_PAYLOAD_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Error extracting author payload: {str(e)}")
+            payload = None
+
+        if not payload:
+            payload = {"affiliations": [], "authors": []}
+
+        return payload
+
+    def build_author_affiliation_mapping(self, payload):
+        author_affiliation_map = {}
+        affiliation_dict = {}
+
+        for aff in payload.get("affiliations", []):
+            try:
+                sup = aff.get("sup")
+                span = aff.get("span")
+                if sup is not None and span is not None:
+                    affiliation_dict[sup.strip()] = span.strip()
+                else:
+                    text = (aff.get("text") or "").strip()
+                    if text:
+                        default_key = "default"
+                        counter = 1
+                        while default_key in affiliation_dict:
+                            default_key = f"default{counter}"
+                            counter += 1
+                        affiliation_dict[default_key] = text
+            except Exception:
+                continue
+
+        num_affiliations = len(affiliation_dict)
+
+        for author in payload.get("authors", []):
+            try:
+                name = author.get("name")
+                if name is None:
                     continue
+                name = name.strip()
 
-        except Exception:
-            pass
+                if not name or name.lower() in ["authors"] or name.startswith("+"):
+                    continue
+
+                superscripts = []
+                for val in author.get("sups", []):
+                    for s in re.split(r"[,\s]+", val.strip()):
+                        if s:
+                            superscripts.append(s)
+
+                if num_affiliations == 1:
+                    superscripts = list(affiliation_dict.keys())
+                elif num_affiliations > 1:
+                    if not superscripts:
+                        first_affiliation = list(affiliation_dict.keys())[0] if affiliation_dict else ""
+                        if first_affiliation:
+                            superscripts = [first_affiliation]
+                        else:
+                            superscripts = []
+                else:
+                    superscripts = []
+
+                author_affiliation_map[name] = superscripts
+
+            except Exception:
+                continue
 
         return author_affiliation_map, affiliation_dict
 
+    def build_author_email_map(self, payload):
+        email_map = {}
+
+        for author in payload.get("authors", []):
+            name = (author.get("name") or "").strip()
+            email = (author.get("email") or "").replace("mailto:", "")
+            if name and name not in email_map:
+                email_map[name] = email
+
+        return email_map
+
+    def extract_author_affiliation_mapping(self, payload=None):
+        if payload is None:
+            payload = self.extract_page_payload()
+
+        return self.build_author_affiliation_mapping(payload)
+
     def contains_llm(self, text):
-        text_lower = text.lower()
-        
-        if re.search(r'\bllms?\b', text_lower):
-            return True
-        
-        if "large language model" in text_lower:
-            return True
-        
-        return False
+        return self.term_matcher.contains(text, self.filter_term)
 
-    def extract_llm_sentences(self, text):        
-        sentences = re.split(r'[.!?]+', text)
-        llm_sentences = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and self.contains_llm(sentence):
-                llm_sentences.append(sentence)
-        
-        return ' | '.join(llm_sentences)
+    def extract_llm_sentences(self, text):
+        return " | ".join(self.term_matcher.sentences_with(text, self.filter_term))
 
     def human_like_delay(self, min_seconds=1, max_seconds=3):
         delay = random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
+        self.metrics.observe("human_like_delay", delay)
+        self.metrics.increment("human_like_delay_seconds", delay)
+
+    def politeness_pause(self):
+        if self.rate_governor:
+            started_at = time.perf_counter()
+            self.rate_governor.acquire()
+            self.metrics.observe("rate_governor_wait", time.perf_counter() - started_at)
+
+        if self.politeness_floor:
+            floor = random.uniform(*self.politeness_floor)
+            elapsed = time.time() - self.last_page_load
+            if elapsed < floor:
+                time.sleep(floor - elapsed)
+                self.metrics.increment("politeness_floor_seconds", floor - elapsed)
+
+        self.last_page_load = time.time()
+
+    def record_page_load(self, started_at, timed_out=False, error=False):
+        if not self.rate_governor:
+            return
+
+        blocked = False
+        if timed_out or error:
+            blocked = self.is_blocked_page()
+
+        self.rate_governor.record(
+            latency=time.time() - started_at,
+            timed_out=timed_out,
+            error=error,
+            blocked=blocked,
+        )
+
+    def is_blocked_page(self):
+        try:
+            return bool(self.driver.execute_script(BLOCKED_PAGE_SCRIPT))
+        except Exception:
+            return False
+
+    def wait_for_document_ready(self, timeout=15):
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda driver: driver.execute_script("return document.readyState")
+                == "complete"
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_results_refresh(self, old_element, timeout=10):
+        try:
+            if old_element is not None:
+                WebDriverWait(self.driver, timeout).until(EC.staleness_of(old_element))
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk")
+                )
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_affiliations_flyout(self, timeout=10):
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(
+                    (
+                        By.CSS_SELECTOR,
+                        "section[data-testid='detailed-information-affiliations'] "
+                        "ul.DetailedInformationFlyout_list__76Ipn li",
+                    )
+                )
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def is_session_valid(self):
+        try:
+            self.driver.get(self.base_url + "/search/form.uri?display=basic")
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located(
+                    (
+                        By.CSS_SELECTOR,
+                        "input[placeholder=' '][class*='styleguide-input_input']",
+                    )
+                )
+            )
+            return urlparse(self.driver.current_url).hostname == urlparse(self.base_url).hostname
+        except Exception:
+            return False
 
     def login_and_access_scopus(self):
+        if self.profile_dir and self.is_session_valid():
+            logger.info("Saved browser session is still valid, skipping library login")
+            return True
+
         try:
             self.driver.get(self.library_url)
-            time.sleep(3)
+            self.wait_for_document_ready()
 
             try:
                 academic_db_button = WebDriverWait(self.driver, 10).until(
@@ -216,7 +2542,6 @@ class ScopusCrawler:
                     )
                 )
                 academic_db_button.click()
-                time.sleep(2)
             except TimeoutException:
                 input("Academic DB button not found. Please click manually and press Enter: ")
 
@@ -229,7 +2554,7 @@ class ScopusCrawler:
 
                 scopus_url = scopus_link.get_attribute("href")
                 self.driver.get(scopus_url)
-                time.sleep(5)
+                self.wait_for_document_ready()
                 
             except TimeoutException:
                 input("Scopus link not found. Please click manually and press Enter: ")
@@ -252,30 +2577,68 @@ class ScopusCrawler:
             )
 
             select = Select(display_select)
-            try:
-                select.select_by_value("10")
-            except:
-                try:
-                    select.select_by_value("20")
-                except:
-                    select.select_by_value("50")
+            available = self.driver.execute_script(
+                "return Array.from(arguments[0].options).map((o) => o.value);",
+                display_select,
+            )
+            sizes = sorted(int(value) for value in available if value.isdigit())
+            if not sizes:
+                raise ValueError("no page size options found")
 
-            time.sleep(3)
-            logger.info("Results per page setting completed")
+            fitting = [size for size in sizes if size <= count]
+            selected_value = str(fitting[-1] if fitting else sizes[0])
+            self.results_per_page = int(selected_value)
+
+            if select.first_selected_option.get_attribute("value") == selected_value:
+                logger.info(f"Results per page already set to {selected_value}")
+                return
+
+            old_rows = self.driver.find_elements(
+                By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk"
+            )
+
+            select.select_by_value(selected_value)
+
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: Select(
+                    driver.find_element(By.CSS_SELECTOR, ".Select-module__vDMww")
+                ).first_selected_option.get_attribute("value")
+                == selected_value
+            )
+            self.wait_for_results_refresh(old_rows[0] if old_rows else None, timeout=30)
+            logger.info(f"Results per page set to {selected_value}")
 
         except Exception as e:
             logger.warning(f"Failed to set results per page: {str(e)}")
+            self.results_per_page = self.read_displayed_page_size() or self.results_per_page
+            logger.info(f"Using displayed page size of {self.results_per_page}")
+
+    def read_displayed_page_size(self):
+        try:
+            display_select = self.driver.find_element(By.CSS_SELECTOR, ".Select-module__vDMww")
+            value = Select(display_select).first_selected_option.get_attribute("value")
+            if value and value.isdigit():
+                return int(value)
+        except Exception:
+            pass
+
+        try:
+            rows = self.driver.find_elements(By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk")
+            return len(rows) or None
+        except Exception:
+            return None
 
+    @timed("search_keyword")
     def search_keyword(self, keyword):
         try:
             current_url = self.driver.current_url
 
             try:
-                base_url = "https://www-scopus-com-ssl.oca.korea.ac.kr"
+                base_url = self.base_url
 
             except Exception:
                 input("Please navigate to Scopus search page manually and press Enter: ")
-                base_url = "https://www-scopus-com-ssl.oca.korea.ac.kr"
+                base_url = self.base_url
 
             try:
                 search_input = WebDriverWait(self.driver, 5).until(
@@ -298,7 +2661,6 @@ class ScopusCrawler:
                     try:
                         search_url = base_url + search_path
                         self.driver.get(search_url)
-                        time.sleep(3)
 
                         search_input = WebDriverWait(self.driver, 5).until(
                             EC.presence_of_element_located(
@@ -370,7 +2732,7 @@ class ScopusCrawler:
             else:
                 input("Please confirm search results are displayed and press Enter: ")
 
-            self.set_results_per_page(10)
+            self.set_results_per_page(self.requested_results_per_page)
 
             logger.info(f"Search for keyword '{keyword}' completed")
             return True
@@ -380,33 +2742,122 @@ class ScopusCrawler:
             input(f"Please search for '{keyword}' manually and press Enter: ")
             return True
 
-    def extract_paper_links(self, paper_elements):
-        paper_links = []
+    def read_result_count(self):
+        try:
+            count = self.driver.execute_script(RESULT_COUNT_SCRIPT)
+            return int(count) if count is not None else None
+        except Exception as e:
+            logger.warning(f"Error reading result count: {str(e)}")
+            return None
+
+    def plan_pages(self, keyword, max_pages):
+        total_results = self.read_result_count()
+        if total_results is None:
+            logger.info(f"Keyword '{keyword}': result count unavailable, planning up to {max_pages} pages")
+            return max_pages, None
+
+        planned_pages = min(max_pages, math.ceil(total_results / self.results_per_page))
+        logger.info(
+            f"Keyword '{keyword}': {total_results} results, planned {planned_pages} pages "
+            f"of {self.results_per_page}"
+        )
+        return planned_pages, total_results
 
-        for i, paper_element in enumerate(paper_elements, 1):
-            try:
-                title_link = paper_element.find_element(By.CSS_SELECTOR, "h3 a")
-                href = title_link.get_attribute("href")
+    def reestablish_session(self, keyword, page_num):
+        logger.warning(f"Re-establishing session for keyword '{keyword}' at page {page_num}")
+        self.metrics.increment("session_resets")
 
-                if href.startswith("http"):
-                    paper_link = href
-                else:
-                    if "oca.korea.ac.kr" in self.driver.current_url:
-                        base_url = "https://www-scopus-com-ssl.oca.korea.ac.kr"
-                    else:
-                        base_url = "https://www.scopus.com"
-                    paper_link = base_url + href
+        try:
+            if self.detail_handle in self.driver.window_handles:
+                self.driver.switch_to.window(self.detail_handle)
+                self.driver.close()
+        except Exception:
+            pass
+
+        try:
+            self.results_handle = None
+            self.detail_handle = None
+            self.driver.switch_to.window(self.driver.window_handles[0])
+        except Exception:
+            pass
 
-                paper_links.append(paper_link)
+        if not self.is_session_valid():
+            self.login_and_access_scopus()
 
-            except Exception as e:
-                logger.warning(f"Error extracting paper link: {str(e)}")
+        if not self.search_keyword(keyword):
+            return False
+
+        if page_num > 1:
+            return self.navigate_to_page(page_num)
+
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk")
+                )
+            )
+        except TimeoutException:
+            logger.warning(f"No results displayed for keyword '{keyword}' after session reset")
+            return False
+
+        return True
+
+    def extract_paper_rows(self, paper_elements):
+        paper_rows = []
+
+        try:
+            raw_rows = self.driver.execute_script(RESULT_ROWS_SCRIPT, paper_elements)
+        except Exception as e:
+            logger.warning(f"Error extracting result rows: {str(e)}")
+            raw_rows = []
+
+        for raw_row in raw_rows or []:
+            href = raw_row.get("href")
+            if not href:
+                logger.warning("Error extracting paper link: title link not found")
                 continue
 
-        return paper_links
+            if href.startswith("http"):
+                paper_link = href
+            else:
+                if urlparse(self.driver.current_url).hostname == urlparse(self.base_url).hostname:
+                    base_url = self.base_url
+                else:
+                    base_url = "https://www.scopus.com"
+                paper_link = base_url + href
+
+            paper_rows.append(
+                {
+                    "link": paper_link,
+                    "title": raw_row.get("title") or "",
+                    "abstract": raw_row.get("abstract") or "",
+                }
+            )
+
+        return paper_rows
 
-    def get_detailed_author_info(self, paper_link):
-        detailed_info = {
+    def extract_paper_links(self, paper_elements):
+        return [row["link"] for row in self.extract_paper_rows(paper_elements)]
+
+    def prefilter_rows(self, paper_rows):
+        if self.prefilter_mode == "off":
+            return [True] * len(paper_rows)
+
+        keep = []
+        for row in paper_rows:
+            if self.contains_llm(row["title"]):
+                keep.append(True)
+            elif self.prefilter_mode == "title":
+                keep.append(False)
+            elif row["abstract"] and not row["abstract"].endswith(("…", "...")):
+                keep.append(self.contains_llm(row["abstract"]))
+            else:
+                keep.append(True)
+
+        return keep
+
+    def empty_detailed_info(self, paper_link):
+        return {
             "authors": [],
             "emails": [],
             "detailed_affiliations": [],
@@ -415,55 +2866,179 @@ class ScopusCrawler:
             "countries": [],
             "detected_sentences": "",
             "link": paper_link,
+            "title": "",
+            "abstract": "",
+            "author_keywords": [],
+            "index_keywords": [],
         }
 
+    def open_detail_page(self, paper_link):
+        if self.results_handle is None:
+            self.results_handle = self.driver.window_handles[0]
+
+        if self.reuse_detail_tab:
+            try:
+                if self.detail_handle not in self.driver.window_handles:
+                    self.driver.switch_to.new_window("tab")
+                    self.detail_handle = self.driver.current_window_handle
+                    self.apply_network_profile()
+                else:
+                    self.driver.switch_to.window(self.detail_handle)
+
+                self.driver.get(paper_link)
+                return
+            except Exception as e:
+                logger.warning(f"Detail tab unavailable, opening a new tab: {str(e)}")
+                self.detail_handle = None
+                try:
+                    self.driver.switch_to.window(self.results_handle)
+                except Exception:
+                    pass
+
+        self.driver.execute_script(f"window.open('{paper_link}', '_blank');")
+        self.driver.switch_to.window(self.driver.window_handles[-1])
+        self.apply_network_profile()
+
+    def close_detail_page(self):
+        if self.detail_handle and self.driver.current_window_handle == self.detail_handle:
+            self.driver.switch_to.window(self.results_handle)
+            return
+
+        self.driver.close()
+        self.driver.switch_to.window(self.results_handle or self.driver.window_handles[0])
+
+    def apply_llm_filter(self, detailed_info, title_text, abstract_text):
+        detailed_info["title"] = title_text
+        detailed_info["abstract"] = abstract_text
+
+        title_has_llm = self.contains_llm(title_text) if title_text else False
+        abstract_has_llm = self.contains_llm(abstract_text) if abstract_text else False
+
+        if not (title_has_llm or abstract_has_llm):
+            detailed_info["detected_sentences"] = SKIPPED_SENTENCES
+            return False
+
+        detailed_info["detected_sentences"] = detect_sentences(
+            self.term_matcher, title_text, abstract_text, self.filter_term
+        )
+        return True
+
+    def fill_author_details(self, detailed_info, payload):
+        detailed_info["author_keywords"] = list((payload or {}).get("keywords") or [])
+        detailed_info["index_keywords"] = list((payload or {}).get("index_keywords") or [])
+
+        author_affiliation_map, affiliation_dict = (
+            self.extract_author_affiliation_mapping(payload)
+        )
+
+        started_at = time.perf_counter()
+        email_map = self.build_author_email_map(payload)
+        self.metrics.observe("email", time.perf_counter() - started_at)
+
+        for name, superscripts in author_affiliation_map.items():
+            detailed_info["authors"].append(name)
+            detailed_info["emails"].append(email_map.get(name, ""))
+
+            affs, affs_raw, univs, countries = [], [], [], []
+            for sup in superscripts:
+                if sup in affiliation_dict:
+                    aff_text = affiliation_dict[sup]
+                    affs.append(aff_text)
+
+                    if sup.startswith("default"):
+                        affs_raw.append(f"[No superscript] {aff_text}")
+                    else:
+                        affs_raw.append(f"[{sup}] {aff_text}")
+
+                    parsed = self.parse_affiliation(aff_text)
+                    univs.append(parsed["university"])
+                    countries.append(parsed["country"])
+
+            if not affs:
+                affs = [""]
+                affs_raw = [""]
+                univs = [""]
+                countries = [""]
+
+            detailed_info["detailed_affiliations"].append(" | ".join(affs))
+            detailed_info["raw_affiliations"].append(" | ".join(affs_raw))
+            detailed_info["universities"].append(" | ".join(univs))
+            detailed_info["countries"].append(" | ".join(countries))
+
+        return detailed_info
+
+    def archive_page(self, paper_link, html):
         try:
-            self.driver.execute_script(f"window.open('{paper_link}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            self.page_archive.append(parse_eid(paper_link) or paper_link, paper_link, html)
+        except Exception as e:
+            logger.warning(f"Failed to archive detail page: {str(e)}")
+
+    def get_detailed_author_info_from_html(self, paper_link, html):
+        if self.page_archive:
+            self.archive_page(paper_link, html)
+
+        title_text, abstract_text, payload = parse_detail_html(html)
+        if not title_text and not abstract_text:
+            return None
+
+        detailed_info = self.empty_detailed_info(paper_link)
+        if not self.apply_llm_filter(detailed_info, title_text, abstract_text):
+            return detailed_info
+
+        if not payload["authors"]:
+            return None
+
+        return self.fill_author_details(detailed_info, payload)
 
-            self.human_like_delay(5, 7)
+    @timed("get_detailed_author_info")
+    @traced_commands
+    def get_detailed_author_info(self, paper_link):
+        detailed_info = self.empty_detailed_info(paper_link)
+
+        try:
+            self.politeness_pause()
+            self.read_transferred_bytes()
+            load_started_at = time.time()
+            phase_started_at = time.perf_counter()
+            self.open_detail_page(paper_link)
+            self.metrics.observe("detail_load", time.perf_counter() - phase_started_at)
 
             title_text = ""
+            phase_started_at = time.perf_counter()
             try:
                 title_element = WebDriverWait(self.driver, 15).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "h2[data-testid='publication-titles']"))
                 )
                 title_text = title_element.text.strip()
+                self.record_page_load(load_started_at)
+            except TimeoutException:
+                self.record_page_load(load_started_at, timed_out=True)
+                self.metrics.increment("title_wait_timeouts")
             except:
-                pass
+                self.record_page_load(load_started_at, error=True)
+            self.metrics.observe("title_wait", time.perf_counter() - phase_started_at)
 
             abstract_text = ""
+            phase_started_at = time.perf_counter()
             try:
                 abstract_element = WebDriverWait(self.driver, 15).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "div[id='document-details-abstract']"))
                 )
                 abstract_text = abstract_element.text.strip()
+            except TimeoutException:
+                self.metrics.increment("abstract_wait_timeouts")
             except:
                 pass
+            self.metrics.observe("abstract_wait", time.perf_counter() - phase_started_at)
 
-            title_has_llm = self.contains_llm(title_text) if title_text else False
-            abstract_has_llm = self.contains_llm(abstract_text) if abstract_text else False
-            
-            if not (title_has_llm or abstract_has_llm):
-                detailed_info["detected_sentences"] = "No LLM keywords found - skipped"
-                
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                return detailed_info
+            if not self.apply_llm_filter(detailed_info, title_text, abstract_text):
+                self.metrics.increment("llm_filter_skips")
+                self.log_page_bytes(paper_link)
 
-            detected_sentences = []
-            if title_has_llm:
-                title_sentences = self.extract_llm_sentences(title_text)
-                if title_sentences:
-                    detected_sentences.append(f"Title: {title_sentences}")
-            
-            if abstract_has_llm:
-                abstract_sentences = self.extract_llm_sentences(abstract_text)
-                if abstract_sentences:
-                    detected_sentences.append(f"Abstract: {abstract_sentences}")
-            
-            detailed_info["detected_sentences"] = " | ".join(detected_sentences)
+                self.close_detail_page()
+                return detailed_info
 
+            phase_started_at = time.perf_counter()
             try:
                 show_all_button = WebDriverWait(self.driver, 10).until(
                     EC.element_to_be_clickable(
@@ -471,62 +3046,38 @@ class ScopusCrawler:
                     )
                 )
                 self.driver.execute_script("arguments[0].click();", show_all_button)
-                time.sleep(5)
+                if not self.wait_for_affiliations_flyout():
+                    self.metrics.increment("show_all_timeouts")
+            except TimeoutException:
+                self.metrics.increment("show_all_timeouts")
             except:
                 pass
+            self.metrics.observe("show_all", time.perf_counter() - phase_started_at)
 
-            author_affiliation_map, affiliation_dict = (
-                self.extract_author_affiliation_mapping()
-            )
+            if self.page_archive:
+                self.archive_page(paper_link, self.driver.page_source)
 
-            for name, superscripts in author_affiliation_map.items():
-                detailed_info["authors"].append(name)
+            phase_started_at = time.perf_counter()
+            payload = self.extract_page_payload()
+            self.metrics.observe("mapping_payload", time.perf_counter() - phase_started_at)
 
-                try:
-                    email_element = self.driver.find_element(
-                        By.XPATH,
-                        f"//span[text()='{name}']/ancestor::li//a[starts-with(@href, 'mailto:')]",
-                    )
-                    email = email_element.get_attribute("href").replace("mailto:", "")
-                    detailed_info["emails"].append(email)
-                except:
-                    detailed_info["emails"].append("")
-
-                affs, affs_raw, univs, countries = [], [], [], []
-                for sup in superscripts:
-                    if sup in affiliation_dict:
-                        aff_text = affiliation_dict[sup]
-                        affs.append(aff_text)
-                        
-                        if sup.startswith("default"):
-                            affs_raw.append(f"[No superscript] {aff_text}")
-                        else:
-                            affs_raw.append(f"[{sup}] {aff_text}")
-                            
-                        parsed = self.parse_affiliation(aff_text)
-                        univs.append(parsed["university"])
-                        countries.append(parsed["country"])
-
-                if not affs:
-                    affs = [""]
-                    affs_raw = [""]
-                    univs = [""]
-                    countries = [""]
-
-                detailed_info["detailed_affiliations"].append(" | ".join(affs))
-                detailed_info["raw_affiliations"].append(" | ".join(affs_raw))
-                detailed_info["universities"].append(" | ".join(univs))
-                detailed_info["countries"].append(" | ".join(countries))
-
-            self.driver.close()
-            self.driver.switch_to.window(self.driver.window_handles[0])
+            phase_started_at = time.perf_counter()
+            self.fill_author_details(detailed_info, payload)
+            self.metrics.observe("mapping", time.perf_counter() - phase_started_at)
+
+            self.log_page_bytes(paper_link)
+            self.close_detail_page()
 
         except Exception as e:
             logger.error(f"Error extracting detailed information: {str(e)}")
+            self.metrics.increment("detail_errors")
             try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+                if self.detail_handle:
+                    self.driver.switch_to.window(self.results_handle)
+                else:
+                    if len(self.driver.window_handles) > 1:
+                        self.driver.close()
+                    self.driver.switch_to.window(self.driver.window_handles[0])
             except:
                 pass
 
@@ -570,108 +3121,169 @@ class ScopusCrawler:
 
         return parsed
 
+    @timed("save_batch_results")
     def save_batch_results(
         self, keyword, papers_data, start_page, end_page, paper_start_index=1
     ):
         try:
-            safe_keyword = re.sub(r"[^\w\s-]", "", keyword).replace(" ", "_")
+            safe_keyword = re.sub(r"[^\w\s-]", "", keyword).replace(" ", "_")[:80]
             filename = f"scopus_{safe_keyword}_pages_{start_page}-{end_page}.xlsx"
 
-            if papers_data:
-                formatted_data = []
-                current_paper_index = paper_start_index
-
-                for paper in papers_data:
-                    authors = paper.get("authors", [""])
-                    emails = paper.get("emails", [""])
-                    affiliations = paper.get("detailed_affiliations", [""])
-                    raw_affiliations = paper.get("raw_affiliations", [""])
-                    universities = paper.get("universities", [""])
-                    countries = paper.get("countries", [""])
-                    detected_sentences = paper.get("detected_sentences", "")
-
-                    max_len = max(
-                        len(authors),
-                        len(emails),
-                        len(affiliations),
-                        len(raw_affiliations),
-                        len(universities),
-                        len(countries),
-                    )
-                    authors.extend([""] * (max_len - len(authors)))
-                    emails.extend([""] * (max_len - len(emails)))
-                    affiliations.extend([""] * (max_len - len(affiliations)))
-                    raw_affiliations.extend([""] * (max_len - len(raw_affiliations)))
-                    universities.extend([""] * (max_len - len(universities)))
-                    countries.extend([""] * (max_len - len(countries)))
-
-                    for i in range(max_len):
-                        formatted_data.append(
-                            {
-                                "Paper Number": (
-                                    current_paper_index if i == 0 else ""
-                                ),
-                                "Author": authors[i] if i < len(authors) else "",
-                                "Email": emails[i] if i < len(emails) else "",
-                                "Affiliation (Raw)": (
-                                    raw_affiliations[i] if i < len(raw_affiliations) else ""
-                                ),
-                                "Affiliation (Department)": (
-                                    affiliations[i] if i < len(affiliations) else ""
-                                ),
-                                "Affiliation (University)": (
-                                    universities[i] if i < len(universities) else ""
-                                ),
-                                "Affiliation (Country)": (
-                                    countries[i] if i < len(countries) else ""
-                                ),
-                                "Detected Sentences": (
-                                    detected_sentences if i == 0 else ""
-                                ),
-                                "Paper Link": (
-                                    paper.get("link", "") if i == 0 else ""
-                                ),
-                            }
-                        )
+            frames = iter_papers_frames(papers_data, paper_start_index)
+            first_frame = next(frames, None)
+            if first_frame is not None:
+                write_excel_sheets(filename, [("Sheet1", itertools.chain([first_frame], frames))])
 
-                    formatted_data.append(
-                        {
-                            "Paper Number": "",
-                            "Author": "",
-                            "Email": "",
-                            "Affiliation (Raw)": "",
-                            "Affiliation (Department)": "",
-                            "Affiliation (University)": "",
-                            "Affiliation (Country)": "",
-                            "Detected Sentences": "",
-                            "Paper Link": "",
-                        }
-                    )
+        except Exception as e:
+            logger.warning(f"Failed to save batch results: {str(e)}")
 
-                    current_paper_index += 1
+    def load_journal_state(self):
+        state = {}
 
-                df = pd.DataFrame(formatted_data)
-                df.to_excel(filename, index=False)
+        for record in self.journal.load():
+            keyword = record.get("keyword")
+            if keyword not in self.queries:
+                continue
 
-                return current_paper_index
+            keyword_state = state.setdefault(
+                keyword,
+                {
+                    "papers": [],
+                    "paper_count": 0,
+                    "last_paper_number": 0,
+                    "done_indices": set(),
+                    "completed": False,
+                },
+            )
 
-        except Exception as e:
-            return paper_start_index
+            if record.get("event") == "keyword_done":
+                keyword_state["completed"] = True
+                continue
+
+            detailed_info = record["paper"]
+            if self.sink:
+                self.sink.write(keyword, detailed_info)
+            else:
+                keyword_state["papers"].append(detailed_info)
+            keyword_state["paper_count"] += 1
+            if isinstance(detailed_info.get("paper_number"), int):
+                keyword_state["last_paper_number"] = max(
+                    keyword_state["last_paper_number"], detailed_info["paper_number"]
+                )
+            page_size = record.get("results_per_page", 10)
+            keyword_state["done_indices"].add(
+                (record["page"] - 1) * page_size + record["position"]
+            )
+
+            key = record.get("eid") or detailed_info.get("link")
+            if key and detailed_info.get("detected_sentences") != SKIPPED_SENTENCES:
+                self.seen_papers.add(key)
+
+        return state
+
+    def journal_paper(self, keyword, page_num, position, detailed_info):
+        if not self.journal or not self.journal.file:
+            return
+
+        self.journal.append(
+            {
+                "keyword": keyword,
+                "keyword_index": self.queries.index(keyword) if keyword in self.queries else None,
+                "page": page_num,
+                "position": position,
+                "results_per_page": self.results_per_page,
+                "eid": parse_eid(detailed_info.get("link", "")),
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "paper": detailed_info,
+            }
+        )
 
-    def crawl_pages(self, keyword, max_pages=200, start_page=1):
-        papers_data = []
-        paper_index = ((start_page - 1) * 2) + 1
+    def crawl_pages(self, keyword, max_pages=None, start_page=1, resume_state=None):
+        resume_state = resume_state or {}
+        papers_data = list(resume_state.get("papers", []))
+        paper_count = resume_state.get("paper_count", 0)
+        done_indices = set(resume_state.get("done_indices", ()))
 
         if not self.search_keyword(keyword):
-            return papers_data
+            return papers_data, False
+
+        if max_pages is None:
+            max_results = self.query_result_limits.get(keyword, self.max_results)
+            max_pages = math.ceil(max_results / self.results_per_page)
+
+        max_pages, total_results = self.plan_pages(keyword, max_pages)
+        if total_results == 0:
+            logger.info(f"Keyword '{keyword}' has no results")
+            return papers_data, True
+
+        if start_page is None:
+            start_page = (max(done_indices) - 1) // self.results_per_page + 1 if done_indices else 1
+
+        paper_index = (start_page - 1) * self.results_per_page + 1
+
+        last_paper_number = resume_state.get("last_paper_number")
+        if last_paper_number:
+            paper_index = last_paper_number + 1
 
         if start_page > 1:
             success = self.navigate_to_page(start_page)
             if not success:
                 start_page = 1
-                paper_index = 1
+                if not last_paper_number:
+                    paper_index = 1
+
+        def finish_page(page):
+            nonlocal paper_index, paper_count
 
-        for page_num in range(start_page, max_pages + 1):
+            fetched_infos = iter(self.finish_detailed_infos(page["batch"], keyword))
+
+            detailed_infos = []
+            for row, kept in zip(page["rows"], page["keep"]):
+                if kept:
+                    detailed_infos.append(next(fetched_infos))
+                else:
+                    skipped_info = self.empty_detailed_info(row["link"])
+                    skipped_info["title"] = row["title"]
+                    skipped_info["abstract"] = row["abstract"]
+                    skipped_info["detected_sentences"] = SKIPPED_SENTENCES
+                    detailed_infos.append(skipped_info)
+                    self.prefilter_skips += 1
+                    self.metrics.increment("prefilter_skips")
+
+            skipped_count = len(page["keep"]) - sum(page["keep"])
+            if skipped_count:
+                logger.info(f"Pre-filter skipped {skipped_count}/{len(page['keep'])} detail pages")
+
+            for position, row, shared_info in zip(page["positions"], page["rows"], detailed_infos):
+                paper_link = row["link"]
+                detailed_info = dict(shared_info)
+                detailed_info["link"] = paper_link
+
+                if detailed_info.get("detected_sentences") != SKIPPED_SENTENCES:
+                    detailed_info["paper_number"] = paper_index
+                    paper_index += 1
+                else:
+                    detailed_info["paper_number"] = "none"
+
+                self.journal_paper(keyword, page["page_num"], position, detailed_info)
+                if self.corpus:
+                    self.corpus.put(parse_eid(paper_link) or paper_link, detailed_info, keyword)
+                if self.sink:
+                    self.sink.write(keyword, detailed_info)
+                else:
+                    papers_data.append(detailed_info)
+                paper_count += 1
+                self.metrics.increment("papers")
+                self.metrics.maybe_export()
+
+        page_num = start_page
+        completed = True
+        pages_crawled = 0
+        consecutive_failures = 0
+        session_resets = 0
+        pending_page = None
+
+        while page_num <= max_pages:
             try:
                 logger.info(f"Crawling keyword '{keyword}' - page {page_num}/{max_pages}")
 
@@ -685,29 +3297,50 @@ class ScopusCrawler:
                     logger.info(f"No more results on page {page_num}.")
                     break
 
-                paper_links = self.extract_paper_links(paper_elements)
-
-                page_papers = []
-                
-                for j, paper_link in enumerate(paper_links, 1):
-                    detailed_info = self.get_detailed_author_info(paper_link)
-                    detailed_info["link"] = paper_link
-
-                    if detailed_info.get("detected_sentences") != "No LLM keywords found - skipped":
-                        detailed_info["paper_number"] = paper_index
-                        paper_index += 1
-                    else:
-                        detailed_info["paper_number"] = "none"
-
-                    page_papers.append(detailed_info)
-                    papers_data.append(detailed_info)
-
-                    self.human_like_delay(2, 4)
+                paper_rows = self.extract_paper_rows(paper_elements)
+                last_page = len(paper_elements) < self.results_per_page or (
+                    total_results is not None
+                    and page_num * self.results_per_page >= total_results
+                )
+                positions = [
+                    position
+                    for position in range(1, len(paper_rows) + 1)
+                    if (page_num - 1) * self.results_per_page + position not in done_indices
+                ]
+                if len(positions) < len(paper_rows):
+                    logger.info(
+                        f"Page {page_num}: {len(paper_rows) - len(positions)} papers already journaled"
+                    )
+                paper_rows = [paper_rows[position - 1] for position in positions]
+                keep = self.prefilter_rows(paper_rows)
+                page = {
+                    "page_num": page_num,
+                    "positions": positions,
+                    "rows": paper_rows,
+                    "keep": keep,
+                    "batch": self.start_detailed_infos(
+                        [row["link"] for row, kept in zip(paper_rows, keep) if kept]
+                    ),
+                }
+                for position in positions:
+                    done_indices.add((page_num - 1) * self.results_per_page + position)
+
+                previous_page, pending_page = pending_page, page
+                if previous_page:
+                    finish_page(previous_page)
+                if not self.fetch_stream:
+                    pending_page = None
+                    finish_page(page)
+
+                pages_crawled += 1
+                consecutive_failures = 0
+
+                if last_page:
+                    logger.info(f"Last page of results reached at page {page_num}.")
+                    break
 
                 if page_num < max_pages:
                     try:
-                        current_url = self.driver.current_url
-                        
                         next_button = self.driver.find_element(
                             By.XPATH, "//button[.//span[text()='Next']]"
                         )
@@ -715,20 +3348,14 @@ class ScopusCrawler:
                         if next_button.is_enabled() and not next_button.get_attribute(
                             "disabled"
                         ):
+                            self.politeness_pause()
+                            load_started_at = time.time()
                             next_button.click()
-                            self.human_like_delay(3, 5)
-                            
-                            new_url = self.driver.current_url
-                            
-                            if current_url == new_url:
-                                try:
-                                    WebDriverWait(self.driver, 10).until(
-                                        EC.staleness_of(paper_elements[0])
-                                    )
-                                except:
-                                    pass
-                            
+                            refreshed = self.wait_for_results_refresh(paper_elements[0])
+                            self.record_page_load(load_started_at, timed_out=not refreshed)
+
                             logger.info(f"Moved to page {page_num + 1}")
+                            page_num += 1
                         else:
                             logger.info("No more next pages available.")
                             break
@@ -738,38 +3365,179 @@ class ScopusCrawler:
                         break
                     except Exception as e:
                         logger.error(f"Error navigating to next page: {str(e)}")
+                        completed = False
                         break
+                else:
+                    break
 
             except Exception as e:
                 logger.error(f"Error crawling page {page_num}: {str(e)}")
-                continue
+                if isinstance(e, TimeoutException) and self.read_result_count() == 0:
+                    logger.info(f"No more results on page {page_num}.")
+                    break
 
-        if papers_data:
-            self.save_batch_results(keyword, papers_data, start_page, page_num, 1)
+                consecutive_failures += 1
+                self.metrics.increment("page_failures")
 
-        logger.info(f"Keyword '{keyword}' crawling completed: {len(papers_data)} papers")
-        return papers_data
+                if self.is_blocked_page():
+                    logger.warning("Blocked page detected, opening the circuit breaker")
+                    consecutive_failures = self.max_page_failures
 
-    def navigate_to_page(self, target_page):
-        try:
-            for i in range(target_page - 1):
-                try:
-                    next_button = self.driver.find_element(
-                        By.XPATH, "//button[.//span[text()='Next']]"
+                if consecutive_failures < self.max_page_failures:
+                    self.navigate_to_page(page_num)
+                    continue
+
+                if session_resets >= self.max_session_resets:
+                    logger.error(
+                        f"Giving up on keyword '{keyword}' at page {page_num} after "
+                        f"{session_resets} session resets"
                     )
-                    if next_button.is_enabled():
-                        next_button.click()
-                        self.human_like_delay(2, 3)
-                    else:
-                        return False
-                except:
-                    return False
+                    completed = False
+                    break
+
+                session_resets += 1
+                consecutive_failures = 0
+                if not self.reestablish_session(keyword, page_num):
+                    logger.error(f"Could not re-establish session for keyword '{keyword}'")
+                    completed = False
+                    break
+
+        if pending_page:
+            finish_page(pending_page)
+
+        logger.info(
+            f"Keyword '{keyword}': planned {max_pages - start_page + 1} pages, "
+            f"crawled {pages_crawled} (stopped at page {page_num})"
+        )
 
+        if paper_count:
+            self.save_batch_results(
+                keyword,
+                self.sink.read(keyword) if self.sink else papers_data,
+                start_page,
+                page_num,
+                1,
+            )
+
+        if completed:
+            logger.info(f"Keyword '{keyword}' crawling completed: {paper_count} papers")
+        else:
+            logger.warning(f"Keyword '{keyword}' stopped early: {paper_count} papers")
+        return papers_data, completed
+
+    @timed("navigate_to_page")
+    def navigate_to_page(self, target_page):
+        if target_page <= 1:
             return True
 
+        started_at = time.time()
+
+        for method, navigate in (
+            ("url jump", self.jump_to_page_by_url),
+            ("pager input", self.jump_to_page_by_pager),
+            ("click walk", self.walk_to_page),
+        ):
+            try:
+                if navigate(target_page):
+                    logger.info(
+                        f"Navigation to page {target_page} took "
+                        f"{time.time() - started_at:.1f}s ({method})"
+                    )
+                    return True
+            except Exception as e:
+                logger.warning(f"Navigation by {method} failed: {str(e)}")
+
+        logger.info(
+            f"Navigation to page {target_page} failed after {time.time() - started_at:.1f}s"
+        )
+        return False
+
+    def get_current_page_number(self):
+        try:
+            page = self.driver.execute_script(CURRENT_PAGE_SCRIPT)
+            return int(page) if page else None
         except Exception:
+            return None
+
+    def build_page_url(self, url, target_page):
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query, keep_blank_values=True)
+
+        if "offset" in query or parsed.path.endswith("results.uri"):
+            query["offset"] = [str((target_page - 1) * self.results_per_page + 1)]
+        else:
+            query["page"] = [str(target_page)]
+
+        return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+    def jump_to_page_by_url(self, target_page):
+        old_rows = self.driver.find_elements(
+            By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk"
+        )
+        original_url = self.driver.current_url
+        page_url = self.build_page_url(original_url, target_page)
+
+        self.politeness_pause()
+        load_started_at = time.time()
+        self.driver.get(page_url)
+        refreshed = self.wait_for_results_refresh(old_rows[0] if old_rows else None)
+        self.record_page_load(load_started_at, timed_out=not refreshed)
+
+        if refreshed and self.get_current_page_number() == target_page:
+            return True
+
+        self.driver.get(original_url)
+        self.wait_for_results_refresh(None)
+        return False
+
+    def jump_to_page_by_pager(self, target_page):
+        pager_inputs = self.driver.find_elements(
+            By.CSS_SELECTOR, "nav[aria-label*='agination'] input, input[aria-label*='page']"
+        )
+        if not pager_inputs:
+            return False
+
+        old_rows = self.driver.find_elements(
+            By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk"
+        )
+
+        self.politeness_pause()
+        load_started_at = time.time()
+        pager_inputs[0].clear()
+        pager_inputs[0].send_keys(str(target_page) + Keys.ENTER)
+        refreshed = self.wait_for_results_refresh(old_rows[0] if old_rows else None)
+        self.record_page_load(load_started_at, timed_out=not refreshed)
+
+        return refreshed and self.get_current_page_number() == target_page
+
+    def walk_to_page(self, target_page):
+        current_page = self.get_current_page_number() or 1
+        if current_page > target_page:
+            logger.info(f"Already past page {target_page} (on page {current_page}), cannot walk back")
             return False
 
+        for i in range(target_page - current_page):
+            next_button = self.driver.find_element(
+                By.XPATH, "//button[.//span[text()='Next']]"
+            )
+            if not next_button.is_enabled():
+                return False
+
+            old_rows = self.driver.find_elements(
+                By.CSS_SELECTOR, "tbody tr.TableItems-module__A6xTk"
+            )
+            self.politeness_pause()
+            load_started_at = time.time()
+            next_button.click()
+            refreshed = self.wait_for_results_refresh(
+                old_rows[0] if old_rows else None
+            )
+            self.record_page_load(load_started_at, timed_out=not refreshed)
+            if not refreshed:
+                return False
+
+        return True
+
     def save_progress(self, keyword, next_page):
         try:
             progress_info = {
@@ -792,94 +3560,106 @@ class ScopusCrawler:
         except Exception as e:
             pass
 
-    def save_to_excel(self, filename="scopus_papers_results.xlsx"):
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            for keyword, papers_data in self.results_data.items():
-                if papers_data:
-                    formatted_data = []
-
-                    for paper_index, paper in enumerate(papers_data, 1):
-                        authors = paper.get("authors", [""])
-                        emails = paper.get("emails", [""])
-                        detailed_affiliations = paper.get("detailed_affiliations", [""])
-                        raw_affiliations = paper.get("raw_affiliations", [""])
-                        universities = paper.get("universities", [""])
-                        countries = paper.get("countries", [""])
-                        detected_sentences = paper.get("detected_sentences", "")
-
-                        max_len = max(
-                            len(authors),
-                            len(emails),
-                            len(detailed_affiliations),
-                            len(raw_affiliations),
-                            len(universities),
-                            len(countries),
-                        )
-                        authors.extend([""] * (max_len - len(authors)))
-                        emails.extend([""] * (max_len - len(emails)))
-                        detailed_affiliations.extend(
-                            [""] * (max_len - len(detailed_affiliations))
-                        )
-                        raw_affiliations.extend([""] * (max_len - len(raw_affiliations)))
-                        universities.extend([""] * (max_len - len(universities)))
-                        countries.extend([""] * (max_len - len(countries)))
-
-                        for i in range(max_len):
-                            formatted_data.append(
-                                {
-                                    "Paper Number": (
-                                        paper_index if i == 0 else ""
-                                    ),
-                                    "Author": authors[i] if i < len(authors) else "",
-                                    "Email": emails[i] if i < len(emails) else "",
-                                    "Affiliation (Raw)": (
-                                        raw_affiliations[i] if i < len(raw_affiliations) else ""
-                                    ),
-                                    "Affiliation (Department)": (
-                                        detailed_affiliations[i]
-                                        if i < len(detailed_affiliations)
-                                        else ""
-                                    ),
-                                    "Affiliation (University)": (
-                                        universities[i] if i < len(universities) else ""
-                                    ),
-                                    "Affiliation (Country)": (
-                                        countries[i] if i < len(countries) else ""
-                                    ),
-                                    "Detected Sentences": (
-                                        detected_sentences if i == 0 else ""
-                                    ),
-                                    "Paper Link": (
-                                        paper.get("link", "") if i == 0 else ""
-                                    ),
-                                }
-                            )
+    def plan_queries(self):
+        if not self.consolidate_queries:
+            return list(self.keywords)
+
+        queries = consolidate_keyword_queries(self.keywords, self.max_query_length)
+        logger.info(f"Consolidated {len(self.keywords)} keyword searches into {len(queries)}")
+        for query in queries:
+            query_clauses = parse_keyword_query(query)
+            merged = [
+                keyword
+                for keyword in self.keywords
+                if any(
+                    query_clause <= clause
+                    for clause in parse_keyword_query(keyword)
+                    for query_clause in query_clauses
+                )
+            ]
+            self.query_result_limits[query] = self.max_results * max(1, len(merged))
+            logger.info(
+                f"Consolidated query ({len(merged)} keywords, "
+                f"up to {self.query_result_limits[query]} results): {query}"
+            )
+        return queries
+
+    def classify_consolidated_results(self, queries):
+        keyword_clauses = {keyword: parse_keyword_query(keyword) for keyword in self.keywords}
+        keyword_papers = {keyword: [] for keyword in self.keywords}
+        keyword_papers[UNASSIGNED_KEYWORD] = []
+
+        seen = set()
+        unclassified = 0
+        for query in queries:
+            if self.sink:
+                papers = list(self.sink.read(query))
+            else:
+                papers = self.results_data.pop(query, [])
 
-                        formatted_data.append(
-                            {
-                                "Paper Number": "",
-                                "Author": "",
-                                "Email": "",
-                                "Affiliation (Raw)": "",
-                                "Affiliation (Department)": "",
-                                "Affiliation (University)": "",
-                                "Affiliation (Country)": "",
-                                "Detected Sentences": "",
-                                "Paper Link": "",
-                            }
-                        )
+            for paper in papers:
+                key = parse_eid(paper["link"]) or paper["link"]
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                text = paper_search_text(paper)
+                matched = [
+                    keyword
+                    for keyword, clauses in keyword_clauses.items()
+                    if matches_query_clauses(clauses, text)
+                ]
+                if not matched:
+                    unclassified += 1
+
+                for keyword in matched or [UNASSIGNED_KEYWORD]:
+                    keyword_papers[keyword].append(dict(paper, keywords=matched))
+
+                if self.corpus:
+                    self.corpus.set_keywords(key, matched)
+
+        for keyword, papers in keyword_papers.items():
+            paper_index = 1
+            for paper in papers:
+                if paper.get("paper_number") != "none":
+                    paper["paper_number"] = paper_index
+                    paper_index += 1
+
+                if self.sink:
+                    self.sink.write(keyword, paper)
+
+            if not self.sink:
+                self.results_data[keyword] = papers
+            logger.info(f"Keyword '{keyword}': {len(papers)} papers from consolidated crawl")
+
+        if unclassified:
+            logger.warning(
+                f"{unclassified}/{len(seen)} papers matched no keyword locally, "
+                f"listed under '{UNASSIGNED_KEYWORD}'"
+            )
 
-                    df = pd.DataFrame(formatted_data)
+    def iter_keyword_results(self):
+        if self.sink:
+            for keyword in self.keywords + [UNASSIGNED_KEYWORD]:
+                yield keyword, self.sink.read(keyword)
+        else:
+            for keyword, papers_data in self.results_data.items():
+                yield keyword, papers_data
+
+    def iter_excel_sheets(self):
+        used = set()
+        for keyword, papers_data in self.iter_keyword_results():
+            yield unique_sheet_name(keyword, used), iter_papers_frames(papers_data)
 
-                    safe_keyword = re.sub(r"[^\w\s-]", "", keyword).strip()[
-                        :31
-                    ]
-                    df.to_excel(writer, sheet_name=safe_keyword, index=False)
+    @timed("save_to_excel")
+    def save_to_excel(self, filename="scopus_papers_results.xlsx"):
+        write_excel_sheets(filename, self.iter_excel_sheets())
 
         logger.info(f"Results saved to {filename}")
 
     def run(self):
         try:
+            self.open_stores()
             self.setup_driver()
 
             if not self.login_and_access_scopus():
@@ -898,34 +3678,307 @@ class ScopusCrawler:
             except:
                 input("Please navigate to Scopus search page manually and press Enter: ")
 
-            total_keywords = len(self.keywords)
+            self.setup_worker_pool()
+
+            if self.fetch_backend == "http":
+                self.http_fetcher = HttpFetcher.from_driver(
+                    self.driver,
+                    concurrency=self.http_concurrency,
+                    rate_governor=self.rate_governor,
+                )
+            elif self.fetch_backend == "async":
+                self.http_fetcher = AsyncFetchEngine.from_driver(
+                    self.driver,
+                    concurrency=self.http_concurrency,
+                    rate_governor=self.rate_governor,
+                )
+
+            self.queries = self.plan_queries()
+
+            if self.sink:
+                self.sink.open(resume=False)
+
+            journal_state = {}
+            start_keyword_index = self.start_keyword_index
+            if self.journal:
+                if self.resume:
+                    journal_state = self.load_journal_state()
+                    start_keyword_index = 0
+                    logger.info(
+                        f"Resuming from journal: "
+                        f"{sum(state['paper_count'] for state in journal_state.values())} papers restored"
+                    )
+                self.journal.open(resume=self.resume)
+
+            queries = self.queries
+            total_keywords = len(queries)
             for idx, keyword in enumerate(
-                self.keywords[self.start_keyword_index :], self.start_keyword_index + 1
+                queries[start_keyword_index:], start_keyword_index + 1
             ):
-                start_page = (
-                    self.start_page if idx == self.start_keyword_index + 1 else 1
-                )
+                keyword_state = journal_state.get(keyword)
 
-                papers_data = self.crawl_pages(
-                    keyword, max_pages=200, start_page=start_page
-                )
+                if keyword_state and keyword_state["completed"]:
+                    if not self.sink:
+                        self.results_data[keyword] = keyword_state["papers"]
+                    logger.info(f"Keyword '{keyword}' already completed in journal")
+                    continue
+
+                if keyword_state:
+                    start_page = None
+                elif self.resume:
+                    start_page = 1
+                else:
+                    start_page = (
+                        self.start_page if idx == self.start_keyword_index + 1 else 1
+                    )
+
+                self.open_fetch_stream()
+                try:
+                    papers_data, completed = self.crawl_pages(
+                        keyword, start_page=start_page, resume_state=keyword_state
+                    )
+                finally:
+                    self.close_fetch_stream()
                 self.results_data[keyword] = papers_data
 
+                if self.journal and completed:
+                    self.journal.append(
+                        {
+                            "event": "keyword_done",
+                            "keyword": keyword,
+                            "keyword_index": queries.index(keyword),
+                            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                        }
+                    )
+
                 if idx < total_keywords:
                     self.human_like_delay(10, 15)
 
+            if self.consolidate_queries:
+                self.classify_consolidated_results(queries)
+
             self.save_to_excel("scopus_papers_results.xlsx")
 
-            total_papers = sum(len(papers) for papers in self.results_data.values())
+            if self.consolidate_queries:
+                total_papers = sum(
+                    sum(1 for _ in papers) for _, papers in self.iter_keyword_results()
+                )
+            elif self.sink:
+                total_papers = self.sink.count()
+            else:
+                total_papers = sum(len(papers) for papers in self.results_data.values())
             print(f"Crawling completed! Total papers: {total_papers}")
+            print(
+                f"Unique papers fetched: {len(self.seen_papers)} "
+                f"(duplicate detail loads skipped: {self.duplicate_skips})"
+            )
+            print(f"Detail loads skipped by pre-filter: {self.prefilter_skips}")
+            if self.measure_bytes:
+                total_bytes = self.bytes_transferred + sum(
+                    worker.bytes_transferred for worker in self.workers
+                )
+                print(f"Bytes transferred: {total_bytes / 1048576:.1f} MB")
+            if self.command_tracer:
+                print(
+                    "WebDriver commands: "
+                    f"{self.command_tracer.format_report(self.command_tracer.report())}"
+                )
 
         except Exception as e:
             logger.error(f"Error during crawling: {str(e)}")
         finally:
+            self.metrics.export()
+            self.close_worker_pool()
+            if self.http_fetcher:
+                self.http_fetcher.close()
+            if self.journal:
+                self.journal.close()
+            if self.sink:
+                self.sink.close()
+            if self.cache:
+                self.cache.close()
+            if self.corpus:
+                self.corpus.close()
+            if self.page_archive:
+                self.page_archive.close()
             if self.driver:
                 self.driver.quit()
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scopus author/affiliation crawler")
+    parser.add_argument("--start-keyword-index", type=int, default=0)
+    parser.add_argument("--start-page", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cache-path", default="scopus_paper_cache.sqlite3")
+    parser.add_argument("--cache-ttl-days", type=float, default=30)
+    parser.add_argument(
+        "--prefilter",
+        choices=["off", "title", "defer"],
+        default="defer",
+        help="Result-list filter: 'title' rejects on title alone, 'defer' leaves "
+        "non-matching titles to the abstract",
+    )
+    parser.add_argument(
+        "--politeness-floor",
+        type=float,
+        nargs=2,
+        default=[0, 0],
+        metavar=("MIN", "MAX"),
+        help="Minimum seconds between page loads per session (0 0 disables)",
+    )
+    parser.add_argument(
+        "--rate-governor-path",
+        default="scopus_rate_governor.sqlite3",
+        help="SQLite file holding the page-load budget shared by all crawler processes",
+    )
+    parser.add_argument(
+        "--results-per-page",
+        type=int,
+        default=10,
+        help="Requested page size; the largest offered size not above it is used (up to 200)",
+    )
+    parser.add_argument(
+        "--max-page-failures",
+        type=int,
+        default=3,
+        help="Consecutive failed result pages before the session is re-established",
+    )
+    parser.add_argument(
+        "--consolidate-queries",
+        action="store_true",
+        help="Crawl one OR'd query for all keywords and assign papers to keywords locally",
+    )
+    parser.add_argument(
+        "--terms",
+        default=None,
+        help='JSON file mapping term labels to regex lists, e.g. {"LLM": ["llms?"]}',
+    )
+    parser.add_argument(
+        "--filter-term",
+        default="LLM",
+        help="Term label a paper must match before its author details are extracted",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=sorted(RESULT_SINKS),
+        default="sqlite",
+        help="Streaming result store that the Excel workbooks are built from",
+    )
+    parser.add_argument("--sink-path", default=None)
+    parser.add_argument("--journal-path", default="scopus_journal.jsonl")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Rebuild results from the journal and continue after the last journaled paper",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run Chrome with --headless=new (login needs a visible browser or a saved session)",
+    )
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Block images, fonts, media and tracking scripts via CDP",
+    )
+    parser.add_argument("--block-css", action="store_true")
+    parser.add_argument(
+        "--measure-bytes",
+        action="store_true",
+        help="Enable Chrome performance logging and log the bytes transferred per detail page",
+    )
+    parser.add_argument(
+        "--fetch-backend",
+        choices=["browser", "http", "async"],
+        default="browser",
+        help="'http' (thread pool) or 'async' (asyncio) fetch detail pages with the "
+        "browser's cookies and fall back to Chrome",
+    )
+    parser.add_argument("--http-concurrency", type=int, default=4)
+    parser.add_argument(
+        "--profile-dir",
+        default=None,
+        help="Chrome user-data-dir that keeps the institutional login between runs",
+    )
+    parser.add_argument(
+        "--chromedriver-path",
+        default=None,
+        help="Use this chromedriver instead of resolving one with webdriver-manager",
+    )
+    parser.add_argument(
+        "--new-tab-per-paper",
+        action="store_true",
+        help="Open and close a tab for every paper instead of reusing one detail tab",
+    )
+    parser.add_argument(
+        "--corpus-path",
+        default="scopus_corpus.sqlite3",
+        help="Compressed store of every visited title/abstract for offline re-classification",
+    )
+    parser.add_argument(
+        "--archive-pages",
+        default=None,
+        metavar="PATH",
+        help="Append each rendered detail page to a zstd archive for offline re-extraction",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached papers and re-fetch every detail page",
+    )
+    parser.add_argument(
+        "--trace-commands",
+        action="store_true",
+        help="Count and time every WebDriver command per crawler method and log a per-paper report",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        default="scopus_metrics.json",
+        help="Per-phase timing summary written during and after the crawl",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        default="scopus_metrics.prom",
+        help="Prometheus textfile-collector output for the same metrics",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    crawler = ScopusCrawler()
+    args = parse_args()
+    crawler = ScopusCrawler(
+        start_keyword_index=args.start_keyword_index,
+        start_page=args.start_page,
+        num_workers=args.workers,
+        cache_path=args.cache_path,
+        corpus_path=args.corpus_path,
+        archive_path=args.archive_pages,
+        cache_ttl_days=args.cache_ttl_days,
+        refresh=args.refresh,
+        prefilter_mode=args.prefilter,
+        politeness_floor=tuple(args.politeness_floor) if any(args.politeness_floor) else None,
+        rate_governor_path=args.rate_governor_path,
+        journal_path=args.journal_path,
+        resume=args.resume,
+        results_per_page=args.results_per_page,
+        max_page_failures=args.max_page_failures,
+        consolidate_queries=args.consolidate_queries,
+        topic_terms=load_terms(args.terms),
+        filter_term=args.filter_term,
+        sink_format=args.sink,
+        sink_path=args.sink_path,
+        headless=args.headless,
+        block_resources=args.block_resources,
+        block_css=args.block_css,
+        measure_bytes=args.measure_bytes,
+        reuse_detail_tab=not args.new_tab_per_paper,
+        profile_dir=args.profile_dir,
+        chromedriver_path=args.chromedriver_path,
+        fetch_backend=args.fetch_backend,
+        http_concurrency=args.http_concurrency,
+        metrics_json_path=args.metrics_json,
+        metrics_prometheus_path=args.metrics_prom,
+        trace_commands=args.trace_commands,
+    )
     crawler.run()
\ No newline at end of file